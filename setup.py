@@ -10,7 +10,7 @@ setup(
         "jinja2>=3.1.2",
         "colorama>=0.4.6",
         "pyyaml>=6.0.1",
-        "toml>=0.10.2",
+        "tomli>=2.0.1; python_version < '3.11'",
         "aiofiles>=23.2.1",
         "asyncio>=3.4.3",
         "typing-extensions>=4.7.1",
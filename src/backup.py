@@ -1,11 +1,29 @@
 # dotfilemanager/backup.py
 
+import asyncio
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List  # Added List here
 import logging
 from .exceptions import BackupError
-from .utils import create_timestamp
+from .utils import create_timestamp, fast_copy
+
+def _copy_symlink(src: str, dst: str) -> None:
+    """
+    Recreates the symlink src at dst, replacing whatever file or link is already there.
+
+    Args:
+        src (str): Path of the symlink to copy.
+        dst (str): Path of the new symlink.
+    """
+    link = os.readlink(src)
+    try:
+        os.symlink(link, dst)
+    except FileExistsError:
+        os.unlink(dst)
+        os.symlink(link, dst)
 
 class BackupManager:
     """
@@ -32,13 +50,17 @@ class BackupManager:
             self.logger.error(f"Failed to create backup directory: {e}")
             raise BackupError(f"Failed to create backup directory: {e}")
 
-    def create_backup(self, repository_name: str, backup_name: str) -> str:
+    def create_backup(self, repository_name: str, backup_name: str, source_dir: Optional[Path] = None) -> str:
         """
         Creates a backup for the given repository.
 
         Args:
             repository_name (str): Name of the repository.
             backup_name (str): Name for the backup.
+            source_dir (Optional[Path]): Directory to snapshot into the backup. Files are
+                copied, never linked, so later edits to the source leave the backup intact;
+                the copy reflinks where the filesystem supports it. The .git directory is
+                left out, since the history can be fetched again from the remote.
 
         Returns:
             str: The full path to the created backup directory.
@@ -53,9 +75,14 @@ class BackupManager:
 
             backup_dir.mkdir(parents=True)
             self.logger.debug(f"Created backup directory at {backup_dir}")
-            # Additional backup logic can be added here (e.g., copying files to backup_dir)
+            if source_dir is not None:
+                shutil.copytree(
+                    source_dir, backup_dir, symlinks=True, ignore=shutil.ignore_patterns('.git'),
+                    copy_function=fast_copy, dirs_exist_ok=True
+                )
+                self.logger.debug(f"Snapshotted {source_dir} into {backup_dir}")
             return str(backup_dir)  # Return the path as a string
-        except OSError as e:
+        except (OSError, shutil.Error) as e:
             self.logger.error(f"Failed to create backup '{backup_name}' for repository '{repository_name}': {e}")
             raise BackupError(f"Failed to create backup '{backup_name}' for repository '{repository_name}': {e}")
 
@@ -80,13 +107,57 @@ class BackupManager:
                 raise BackupError(f"Backup '{backup_name}' does not exist for repository '{repository_name}'.")
 
             # Restore logic: copy backup contents to target_dir
-            shutil.copytree(backup_dir, target_dir, dirs_exist_ok=True)
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                asyncio.run(self._copy_tree_async(backup_dir, target_dir))
+            else:
+                # asyncio.run refuses to nest, so a caller inside a loop gets a loop of its own
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    executor.submit(asyncio.run, self._copy_tree_async(backup_dir, target_dir)).result()
             self.logger.debug(f"Restored backup '{backup_name}' to {target_dir}")
             return True
         except (OSError, shutil.Error) as e:
             self.logger.error(f"Failed to restore backup '{backup_name}' for repository '{repository_name}': {e}")
             raise BackupError(f"Failed to restore backup '{backup_name}' for repository '{repository_name}': {e}")
 
+    async def _copy_tree_async(self, source_dir: Path, target_dir: Path, max_parallel: int = 16) -> None:
+        """
+        Copies a directory tree with many file copies in flight at once.
+
+        The directory skeleton is created up front, then every file is copied
+        with fast_copy on the default executor and awaited together, with at most
+        max_parallel copies in flight. Symlinks are recreated as symlinks and never
+        followed, matching how create_backup stores them.
+
+        Args:
+            source_dir (Path): Directory to copy from.
+            target_dir (Path): Directory to copy into.
+            max_parallel (int): Upper bound on concurrent copies.
+        """
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def copy_one(src: str, dst: str) -> None:
+            async with semaphore:
+                await asyncio.to_thread(fast_copy, src, dst)
+
+        copies = []
+        pending = [(str(source_dir), str(target_dir))]
+        while pending:
+            src_root, dest_root = pending.pop()
+            os.makedirs(dest_root, exist_ok=True)
+            dest_prefix = os.path.join(dest_root, '')
+            with os.scandir(src_root) as it:
+                for entry in it:
+                    dest = dest_prefix + entry.name
+                    if entry.is_symlink():
+                        _copy_symlink(entry.path, dest)
+                    elif entry.is_dir():
+                        pending.append((entry.path, dest))
+                    else:
+                        copies.append(copy_one(entry.path, dest))
+        await asyncio.gather(*copies)
+
     def list_backups(self, repository_name: str) -> List[str]:
         """
         Lists all backups for a given repository.
@@ -102,11 +173,13 @@ class BackupManager:
         """
         try:
             repo_backup_dir = self.backup_base_dir / repository_name
-            if not repo_backup_dir.exists():
+            try:
+                with os.scandir(repo_backup_dir) as it:
+                    backups = [entry.name for entry in it if entry.is_dir()]
+            except FileNotFoundError:
                 self.logger.warning(f"No backups found for repository '{repository_name}'.")
                 return []  # Return an empty list if no backups are found
 
-            backups = [backup.name for backup in repo_backup_dir.iterdir() if backup.is_dir()]
             self.logger.debug(f"Found backups for '{repository_name}': {backups}")
             return backups
         except OSError as e:
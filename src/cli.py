@@ -4,20 +4,56 @@ import argparse
 import sys
 import logging
 import os
+import stat
 import json
+from pathlib import Path
 from typing import Dict, Any, Callable, List, Tuple
 from colorama import init, Fore, Style
 import datetime
-import shutil
 
-from .utils import sanitize_url, exception_handler
+from .utils import sanitize_url, exception_handler, fast_copy
 from .logger import setup_logger  # Updated import
 from .package_manager import PackageManager
 from .dotfile_manager import DotfileManager
-from .config import ConfigManager
+from .config import ConfigManager, _loads
 
 init()  # Initialize colorama for colored output
 
+# expanduser consults the environment and passwd database on every call
+_HOME = os.path.expanduser("~")
+
+def _walk_relative(directory: str, start: str = None):
+    """
+    Yields (path, relative_path) for every file under directory.
+
+    The relative prefix is computed once and extended per directory rather than
+    calling os.path.relpath for every file.
+    """
+    rel_root = os.curdir if start is None else os.path.relpath(directory, start)
+    yield from _scan_files(directory, '' if rel_root == os.curdir else rel_root + os.sep)
+
+def _scan_files(directory: str, rel_prefix: str):
+    """
+    Yields (path, relative_path) for files under directory, using os.scandir so file
+    and directory checks come from the listing.
+
+    Like os.walk, a directory's files come before its subdirectories, symlinked
+    directories are not descended into, and unreadable directories are skipped.
+    """
+    try:
+        it = os.scandir(directory)
+    except OSError:
+        return
+    subdirs = []
+    with it:
+        for entry in it:
+            if not entry.is_dir():
+                yield entry.path, rel_prefix + entry.name
+            elif not entry.is_symlink():
+                subdirs.append(entry)
+    for entry in subdirs:
+        yield from _scan_files(entry.path, rel_prefix + entry.name + os.sep)
+
 def print_profiles(profiles: Dict[str, Any], active_profile: str) -> None:
     """Pretty print the profiles information."""
     if not profiles:
@@ -101,8 +137,11 @@ def handle_preview(args: argparse.Namespace, dotfile_manager: DotfileManager, pa
     # Preview packages
     if 'packages' in profile_config:
         packages = profile_config['packages']
-        installed = [pkg for pkg in packages if dotfile_manager._check_installed_packages([pkg])]
-        to_install = [pkg for pkg in packages if pkg not in installed]
+        # One installed-package query for the whole list, then a set lookup per package
+        installed_set = dotfile_manager._check_installed_packages(packages)
+        installed, to_install = [], []
+        for pkg in packages:
+            (installed if pkg in installed_set else to_install).append(pkg)
 
         print(f"\n{Fore.CYAN}Package Changes:{Style.RESET_ALL}")
         if to_install:
@@ -123,20 +162,19 @@ def handle_preview(args: argparse.Namespace, dotfile_manager: DotfileManager, pa
 
     for directory in dotfile_dirs:
         print(f"\n{Fore.YELLOW}Directory: {directory}{Style.RESET_ALL}")
-        target_dir = os.path.expanduser('~')
-        for root, _, files in os.walk(directory):
-            for file in files:
-                src_path = os.path.join(root, file)
-                rel_path = os.path.relpath(src_path, directory)
-                dst_path = os.path.join(target_dir, rel_path)
-
-                if os.path.exists(dst_path):
-                    if os.path.islink(dst_path):
-                        print(f"  ~ {rel_path} (will update symlink)")
-                    else:
-                        print(f"  ! {rel_path} (will backup and replace)")
-                else:
-                    print(f"  + {rel_path} (will create)")
+        target_prefix = os.path.join(_HOME, '')
+        for _, rel_path in _walk_relative(directory):
+            dst_path = target_prefix + rel_path
+
+            try:
+                st = os.lstat(dst_path)
+            except FileNotFoundError:
+                print(f"  + {rel_path} (will create)")
+                continue
+            if stat.S_ISLNK(st.st_mode):
+                print(f"  ~ {rel_path} (will update symlink)")
+            else:
+                print(f"  ! {rel_path} (will backup and replace)")
 
 def handle_diff(args: argparse.Namespace, dotfile_manager: DotfileManager, package_manager: PackageManager, logger: logging.Logger) -> None:
     """Handles the 'diff' command."""
@@ -162,54 +200,57 @@ def handle_diff(args: argparse.Namespace, dotfile_manager: DotfileManager, packa
 
     print(f"\n{Fore.CYAN}Configuration Differences:{Style.RESET_ALL}")
 
+    home_prefix = os.path.join(_HOME, '')
     for directory in dotfile_dirs:
-        for root, _, files in os.walk(directory):
-            for file in files:
-                src_path = os.path.join(root, file)
-                rel_path = os.path.relpath(src_path, directory)
-                dst_path = os.path.join(os.path.expanduser('~'), rel_path)
-
-                if os.path.exists(dst_path) and os.path.isfile(dst_path):
-                    try:
-                        with open(src_path, 'r') as f1, open(dst_path, 'r') as f2:
-                            src_lines = f1.readlines()
-                            dst_lines = f2.readlines()
-
-                            diff = list(unified_diff(
-                                dst_lines, src_lines,
-                                fromfile=f"current/{rel_path}",
-                                tofile=f"new/{rel_path}"
-                            ))
-
-                            if diff:
-                                print(f"\n{Fore.YELLOW}File: {rel_path}{Style.RESET_ALL}")
-                                for line in diff:
-                                    if line.startswith('+'):
-                                        print(f"{Fore.GREEN}{line.rstrip()}{Style.RESET_ALL}")
-                                    elif line.startswith('-'):
-                                        print(f"{Fore.RED}{line.rstrip()}{Style.RESET_ALL}")
-                                    else:
-                                        print(line.rstrip())
-                    except UnicodeDecodeError:
-                        print(f"\n{Fore.YELLOW}File: {rel_path} (binary file){Style.RESET_ALL}")
-                elif not os.path.exists(dst_path):
-                    print(f"\n{Fore.GREEN}New file: {rel_path}{Style.RESET_ALL}")
+        for src_path, rel_path in _walk_relative(directory):
+            dst_path = home_prefix + rel_path
+
+            if os.path.exists(dst_path) and os.path.isfile(dst_path):
+                try:
+                    with open(src_path, 'r') as f1, open(dst_path, 'r') as f2:
+                        src_lines = f1.readlines()
+                        dst_lines = f2.readlines()
+
+                        diff = list(unified_diff(
+                            dst_lines, src_lines,
+                            fromfile=f"current/{rel_path}",
+                            tofile=f"new/{rel_path}"
+                        ))
+
+                        if diff:
+                            print(f"\n{Fore.YELLOW}File: {rel_path}{Style.RESET_ALL}")
+                            for line in diff:
+                                if line.startswith('+'):
+                                    print(f"{Fore.GREEN}{line.rstrip()}{Style.RESET_ALL}")
+                                elif line.startswith('-'):
+                                    print(f"{Fore.RED}{line.rstrip()}{Style.RESET_ALL}")
+                                else:
+                                    print(line.rstrip())
+                except UnicodeDecodeError:
+                    print(f"\n{Fore.YELLOW}File: {rel_path} (binary file){Style.RESET_ALL}")
+            elif not os.path.exists(dst_path):
+                print(f"\n{Fore.GREEN}New file: {rel_path}{Style.RESET_ALL}")
 
 def handle_search(args: argparse.Namespace, dotfile_manager: DotfileManager, package_manager: PackageManager, logger: logging.Logger) -> None:
     """Handles the 'search' command."""
     import fnmatch
+    import re
 
-    def search_content(file_path, query):
+    def search_content(file_path, query_re):
         try:
             with open(file_path, 'r') as f:
                 for i, line in enumerate(f, 1):
-                    if query.lower() in line.lower():
+                    if query_re.search(line):
                         return i, line.strip()
             return None
         except UnicodeDecodeError:
             return None
 
     logger.info(f"Searching for: {args.query}")
+    # Case-insensitive match without lowercasing every line
+    query_re = re.compile(re.escape(args.query), re.IGNORECASE)
+    # Translate the filename glob once instead of per file
+    name_re = re.compile(fnmatch.translate(f"*{args.query.lower()}*"))
 
     # Get repositories to search
     if args.repository:
@@ -233,26 +274,19 @@ def handle_search(args: argparse.Namespace, dotfile_manager: DotfileManager, pac
         dotfile_dirs = dotfile_manager._discover_dotfile_directories(local_dir)
 
         for directory in dotfile_dirs:
-            for root, _, files in os.walk(directory):
-                for file in files:
-                    if fnmatch.fnmatch(file.lower(), f"*{args.query.lower()}*"):
-                        rel_path = os.path.relpath(
-                            os.path.join(root, file),
-                            local_dir
-                        )
-                        print(f"{Fore.GREEN}Found in filename:{Style.RESET_ALL} {rel_path}")
+            for file_path, rel_path in _walk_relative(directory, local_dir):
+                if name_re.match(os.path.basename(file_path).lower()):
+                    print(f"{Fore.GREEN}Found in filename:{Style.RESET_ALL} {rel_path}")
+                    found_something = True
+
+                if args.content:
+                    result = search_content(file_path, query_re)
+                    if result:
+                        line_num, line = result
+                        print(f"{Fore.YELLOW}Found in content:{Style.RESET_ALL} {rel_path}:{line_num}")
+                        print(f"  {line}")
                         found_something = True
 
-                    if args.content:
-                        file_path = os.path.join(root, file)
-                        result = search_content(file_path, args.query)
-                        if result:
-                            line_num, line = result
-                            rel_path = os.path.relpath(file_path, local_dir)
-                            print(f"{Fore.YELLOW}Found in content:{Style.RESET_ALL} {rel_path}:{line_num}")
-                            print(f"  {line}")
-                            found_something = True
-
     if not found_something:
         print(f"\n{Fore.YELLOW}No matches found for: {args.query}{Style.RESET_ALL}")
 
@@ -274,7 +308,10 @@ def handle_profile_switch(args: argparse.Namespace, dotfile_manager: DotfileMana
 
 def handle_backup_create(args: argparse.Namespace, dotfile_manager: DotfileManager, package_manager: PackageManager, logger: logging.Logger) -> None:
     """Handles the 'backup create' command."""
-    backup_id = dotfile_manager.backup_manager.create_backup(args.repository_name, args.backup_name)
+    config = dotfile_manager.config_manager.get_rice_config(args.repository_name) or {}
+    local_dir = config.get("local_directory")
+    source_dir = Path(local_dir) if local_dir and os.path.isdir(local_dir) else None
+    backup_id = dotfile_manager.backup_manager.create_backup(args.repository_name, args.backup_name, source_dir=source_dir)
     if backup_id:
         print(f"{Fore.GREEN}✓ Created backup: {args.backup_name} (ID: {backup_id}){Style.RESET_ALL}")
 
@@ -322,17 +359,18 @@ def handle_export(args: argparse.Namespace, dotfile_manager: DotfileManager, pac
     if args.include_assets:
         assets = {}
         asset_dirs = ["wallpapers", "icons", "fonts", "themes"]
+        local_dir = config.get("local_directory", "")
+        # One directory read instead of an exists() probe per asset directory
+        try:
+            with os.scandir(local_dir) as it:
+                entries = {entry.name: entry for entry in it}
+        except OSError:
+            entries = {}
         for asset_dir in asset_dirs:
-            dir_path = os.path.join(config.get("local_directory", ""), asset_dir)
-            if os.path.exists(dir_path):
-                assets[asset_dir] = []
-                for root, _, files in os.walk(dir_path):
-                    for file in files:
-                        rel_path = os.path.relpath(
-                            os.path.join(root, file),
-                            dir_path
-                        )
-                        assets[asset_dir].append(rel_path)
+            entry = entries.get(asset_dir)
+            if entry is not None and entry.is_dir():
+                dir_path = entry.path
+                assets[asset_dir] = [rel_path for _, rel_path in _walk_relative(dir_path)]
         export_data["assets"] = assets
 
     # Save export data
@@ -350,8 +388,8 @@ def handle_import(args: argparse.Namespace, dotfile_manager: DotfileManager, pac
     logger.info(f"Importing configuration from: {args.file}")
 
     try:
-        with open(args.file, "r") as f:
-            import_data = json.load(f)
+        with open(args.file, "rb") as f:
+            import_data = _loads(f.read())
     except Exception as e:
         logger.error(f"Failed to read import file: {e}")
         sys.exit(1)
@@ -365,15 +403,15 @@ def handle_import(args: argparse.Namespace, dotfile_manager: DotfileManager, pac
     # Use provided name or original name
     repo_name = args.name or import_data["name"]
 
-    # Create configuration
+    # Create configuration and import profiles, saving the config file once
     config = import_data["config"]
-    dotfile_manager.config_manager.add_rice_config(repo_name, config)
+    with dotfile_manager.config_manager.batch_update():
+        dotfile_manager.config_manager.add_rice_config(repo_name, config)
 
-    # Import profiles
-    if "profiles" in import_data:
-        for profile_name, profile_data in import_data["profiles"].items():
-            dotfile_manager.config_manager.create_profile(repo_name, profile_name)
-            dotfile_manager.config_manager.update_profile(repo_name, profile_name, profile_data)
+        if "profiles" in import_data:
+            for profile_name, profile_data in import_data["profiles"].items():
+                dotfile_manager.config_manager.create_profile(repo_name, profile_name)
+                dotfile_manager.config_manager.update_profile(repo_name, profile_name, profile_data)
 
     # Install dependencies if included and not skipped
     if "dependencies" in import_data and not args.skip_deps:
@@ -387,14 +425,19 @@ def handle_import(args: argparse.Namespace, dotfile_manager: DotfileManager, pac
         assets = import_data["assets"]
         if assets:
             logger.info("Processing assets...")
+            local_directory = config.get("local_directory", "")
             for asset_type, asset_files in assets.items():
-                target_dir = os.path.expanduser(f"~/.local/share/{asset_type}")
+                target_dir = os.path.join(_HOME, ".local", "share", asset_type)
                 os.makedirs(target_dir, exist_ok=True)
+                # Join the per-type prefixes once, not for every asset file
+                src_prefix = os.path.join(local_directory, asset_type, '')
+                dst_prefix = os.path.join(target_dir, '')
                 for asset_file in asset_files:
-                    src = os.path.join(config.get("local_directory", ""), asset_type, asset_file)
-                    dst = os.path.join(target_dir, os.path.basename(asset_file))
-                    if os.path.exists(src):
-                        shutil.copy2(src, dst)
+                    # Missing sources are skipped on open rather than probed beforehand
+                    try:
+                        fast_copy(src_prefix + asset_file, dst_prefix + os.path.basename(asset_file))
+                    except FileNotFoundError:
+                        continue
 
     print(f"{Fore.GREEN}✓ Successfully imported configuration as: {repo_name}{Style.RESET_ALL}")
 
@@ -474,7 +517,10 @@ def _handle_manage_apply_command(args: argparse.Namespace, dotfile_manager: Dotf
         else:
             custom_paths = None
         if manage:
-            if not dotfile_manager.manage_dotfiles(args.profile_name, args.target_files, args.dry_run):
+            if not dotfile_manager.manage_dotfiles(
+                args.profile_name, args.target_files, args.dry_run,
+                link_mode='hardlink' if args.hardlink else 'copy'
+            ):
                 sys.exit(1)
         else:
             if not dotfile_manager.apply_dotfiles(args.repository_name, stow_options, package_manager, target_packages, args.overwrite_symlink, custom_paths, args.ignore_rules, args.template_context, args.discover_templates, args.custom_scripts):
@@ -522,6 +568,7 @@ COMMANDS = {
             ("--target-files", {"help": "Comma-separated list of files to manage"}),
             ("--dry-run", {"action": "store_true", "help": "Preview changes without applying them"}),
             ("--stow-options", {"help": "Space-separated GNU Stow options"}),
+            ("--hardlink", {"action": "store_true", "help": "Hardlink copied files when on the same filesystem"}),
         ],
         "handler": handle_manage,
     },
@@ -1,12 +1,49 @@
 # dotfilemanager/config.py
 import json
+import os
+import stat
+import tempfile
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 import logging
 
 from .exceptions import ConfigurationError
 from .utils import create_timestamp
 
+try:
+    import orjson
+
+    def _dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(data: Any) -> bytes:
+        return json.dumps(data, indent=2).encode('utf-8')
+
+    _loads = json.loads
+
+# Read once at import: os.umask can only be queried by setting it, which races other threads
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+def _existing_or_default_mode(path: Path) -> int:
+    """
+    Returns the permission bits of path, or those a new file would get under the umask.
+
+    Args:
+        path (Path): File about to be replaced.
+
+    Returns:
+        int: Permission bits for the replacement file.
+    """
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
 class RepositoryConfig:
     """
     Represents the configuration for a specific rice repository (e.g., from rice.json).
@@ -50,11 +87,10 @@ class RepositoryConfig:
 
         try:
             if self.path and self.path.exists():
-                with self.path.open("r", encoding="utf-8") as f:
-                    config = json.load(f)
-                    self.logger.debug(f"Loaded repository configuration from {self.path}")
-                    # Merge with default config to ensure all required fields exist
-                    return self._merge_configs(default_config, config)
+                config = _loads(self.path.read_bytes())
+                self.logger.debug(f"Loaded repository configuration from {self.path}")
+                # Merge with default config to ensure all required fields exist
+                return self._merge_configs(default_config, config)
             else:
                 self.logger.info("No repository configuration file found. Using default configuration.")
                 return default_config
@@ -132,6 +168,10 @@ class ConfigManager:
     Manages loading, saving, and updating configurations.
     """
 
+    # Raw config file bytes keyed by path and validated by (st_mtime_ns, st_size, st_ino)
+    _read_cache: Dict[str, Tuple[Tuple[int, int, int], bytes]] = {}
+    _read_cache_lock = threading.Lock()
+
     def __init__(self, config_path: Optional[Path] = None, logger: Optional[logging.Logger] = None):
         """
         Initializes the ConfigManager.
@@ -143,14 +183,46 @@ class ConfigManager:
         self.logger = logger or logging.getLogger("DotfileManager")
         self.config_path = config_path or Path.home() / ".dotfilemanager" / "config.json"
         self.config_data: Dict[str, Any] = {}
-        self._load_config()  # Load config on initialization
+        self._batch_depth = 0
+        self.config_data = self._load_config()  # Load config on initialization
+
+    @classmethod
+    def _read_json_cached(cls, path: Path) -> Any:
+        """
+        Reads a JSON file, reusing its bytes while the file is unchanged on disk.
+
+        Args:
+            path (Path): Path to the JSON file.
+
+        Returns:
+            Any: Parsed JSON data, freshly parsed on every call.
+        """
+        key = str(path.absolute())
+        st = os.stat(key)
+        signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+        with cls._read_cache_lock:
+            cached = cls._read_cache.get(key)
+        if cached and cached[0] == signature:
+            return _loads(cached[1])
+
+        with open(key, 'rb') as f:
+            raw = f.read()
+        with cls._read_cache_lock:
+            cls._read_cache[key] = (signature, raw)
+        return _loads(raw)
+
+    @classmethod
+    def _invalidate_cached(cls, path: Path) -> None:
+        """Drops the cached bytes of a JSON file after it has been written."""
+        with cls._read_cache_lock:
+            cls._read_cache.pop(str(path.absolute()), None)
+
     def _load_config(self) -> Dict[str, Any]:
         if self.config_path.exists():
             try:
-                with self.config_path.open('r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.logger.debug(f"Loaded configuration from {self.config_path}")
-                    return data
+                data = self._read_json_cached(self.config_path)
+                self.logger.debug(f"Loaded configuration from {self.config_path}")
+                return data
             except json.JSONDecodeError as e:
                 self.logger.error(f"Invalid JSON in config file: {e}")
                 raise ConfigurationError(f"Invalid JSON in config file: {e}")
@@ -163,15 +235,54 @@ class ConfigManager:
 
 
     def _save_config(self) -> None:
+        if self._batch_depth:
+            # Deferred until the outermost batch_update block exits
+            return
         try:
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
-            with self.config_path.open('w', encoding='utf-8') as f:
-                json.dump(self.config_data, f, indent=4)
-                self.logger.debug(f"Saved configuration to {self.config_path}")
+            # Write to a sibling temp file and swap it in, so readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=self.config_path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    # mkstemp creates the file 0600; keep the mode a plain write would have left
+                    os.fchmod(f.fileno(), _existing_or_default_mode(self.config_path))
+                    f.write(_dumps(self.config_data))
+                os.replace(tmp_path, self.config_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            self._invalidate_cached(self.config_path)
+            self.logger.debug(f"Saved configuration to {self.config_path}")
         except Exception as e:
             self.logger.error(f"Failed to save config file: {e}")
             raise ConfigurationError(f"Failed to save config file: {e}")
             
+    @contextmanager
+    def batch_update(self, repository_name: Optional[str] = None):
+        """
+        Context manager that defers config writes and saves once on exit.
+
+        The save happens on every exit that is not an exception, including an early
+        return from inside the block; to abandon an update, raise or keep the
+        mutations outside the block until they should be kept.
+
+        Args:
+            repository_name (Optional[str]): Name of the repository whose config is yielded.
+
+        Yields:
+            Dict[str, Any]: The rice configuration, or the whole config data if no name is given.
+        """
+        self._batch_depth += 1
+        try:
+            if repository_name is None:
+                yield self.config_data
+            else:
+                yield self.config_data.setdefault('rices', {}).setdefault(repository_name, {})
+        finally:
+            self._batch_depth -= 1
+        if not self._batch_depth:
+            self._save_config()
+
     def add_rice_config(self, repository_name: str, config: Dict[str, Any]) -> None:
         """
         Adds or updates a rice configuration.
@@ -295,6 +406,39 @@ class ConfigManager:
         """
         return {repo: config.get('profiles', {}) for repo, config in self.config_data.get('rices', {}).items()}
 
+    def get_applied_rice(self) -> Optional[str]:
+        """
+        Retrieves the currently applied rice.
+
+        Returns:
+            Optional[str]: Name of the applied rice if any, else None.
+        """
+        rices = self.config_data.get('rices', {})
+        applied = self.config_data.get('applied_rice')
+        if applied in rices:
+            return applied
+        # Configs written before the index existed only carry per-rice flags
+        for repo_name, config in rices.items():
+            if config.get('applied', False):
+                return repo_name
+        return None
+
+    def set_applied_rice(self, repository_name: Optional[str]) -> None:
+        """
+        Records which rice is applied, keeping the per-rice 'applied' flags in sync.
+
+        Args:
+            repository_name (Optional[str]): Name of the applied repository, or None to clear.
+        """
+        rices = self.config_data.setdefault('rices', {})
+        previous = self.get_applied_rice()
+        if previous in rices:
+            rices[previous]['applied'] = False
+        if repository_name in rices:
+            rices[repository_name]['applied'] = True
+        self.config_data['applied_rice'] = repository_name
+        self._save_config()
+
     def get_active_profile(self, repository_name: str) -> Optional[str]:
         """
         Retrieves the active profile for a specific repository.
@@ -376,6 +520,8 @@ class ConfigManager:
         """
         if 'rices' in self.config_data and repository_name in self.config_data['rices']:
             del self.config_data['rices'][repository_name]
+            if self.config_data.get('applied_rice') == repository_name:
+                self.config_data['applied_rice'] = None
             self._save_config()
             self.logger.debug(f"Removed rice configuration for '{repository_name}'")
         else:
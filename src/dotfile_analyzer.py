@@ -1,20 +1,181 @@
 # src/dotfile_analyzer.py
 
 import json
+import os
 import re
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 import logging
-import toml
-import yaml
 
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+if tomllib is not None:
+    def _load_toml(file_path: Path) -> Dict[str, Any]:
+        with file_path.open('rb') as f:
+            return tomllib.load(f)
+
+    _TomlDecodeError = tomllib.TOMLDecodeError
+else:
+    import toml
+
+    def _load_toml(file_path: Path) -> Dict[str, Any]:
+        return toml.loads(file_path.read_text(encoding='utf-8'))
+
+    _TomlDecodeError = toml.TomlDecodeError
+
+try:
+    import ijson
+except ImportError:  # Optional; large JSON files are then parsed whole
+    ijson = None
+
+from .config import _loads
 from .exceptions import ValidationError
 
+# Package names following a dependency keyword, matched on lowercased file bytes
+_DEP_RE = re.compile(rb'\b(?:dependencies|depends?(?:_?on)?|requires?|packages?)\b\s*:?\s*([\w-]+)')
+# Literal stems of those keywords; a file containing none of them cannot match
+_DEP_KEYWORD_STEMS = (b'depend', b'require', b'package')
+
+# Media, font and archive files; they declare no dependencies and are often the
+# largest files in a rice, so they are never read
+_BINARY_SUFFIXES = (
+    '.png', '.jpg', '.jpeg', '.gif', '.webp', '.bmp', '.ico', '.xcf',
+    '.ttf', '.otf', '.woff', '.woff2',
+    '.mp3', '.ogg', '.wav', '.flac', '.mp4', '.mkv', '.webm',
+    '.zip', '.tar', '.gz', '.xz', '.zst', '.pdf'
+)
+
+# Suffixes and keys that identify dependency declarations in structured files
+_YAML_SUFFIXES = frozenset({'.yaml', '.yml'})
+_JSON_DEP_KEYS = ('dependencies', 'devDependencies')
+# JSON files at least this large are streamed with ijson when it is available
+_JSON_STREAM_MIN_SIZE = 64 * 1024
+_TOML_DEP_SECTIONS = ('dependencies', 'build-dependencies', 'dev-dependencies')
+_YAML_DEP_KEYS = ('dependencies', 'requires')
+_YAML_DEP_KEYS_BYTES = tuple(key.encode() for key in _YAML_DEP_KEYS)
+
+# Version control directories never descended into
+_VCS_DIRS = frozenset({'.git', '.svn', '.hg'})
+
+# Path components (lowercased) that mark wallpaper collections
+_WALLPAPER_DIRS = frozenset({'wallpapers', 'backgrounds'})
+
+# Known configuration directories and their target locations
+_KNOWN_CONFIG_DIRS: Dict[str, Tuple[str, str]] = {
+    # Shell configs
+    'oh-my-zsh': ('home', '.oh-my-zsh'),
+    'zsh': ('home', '.zsh'),
+    'bash': ('home', '.bash'),
+    'fish': ('config', 'fish'),
+
+    # Terminal emulators
+    'kitty': ('config', 'kitty'),
+    'alacritty': ('config', 'alacritty'),
+    'wezterm': ('config', 'wezterm'),
+
+    # Window managers and desktop environment
+    'i3': ('config', 'i3'),
+    'hypr': ('config', 'hypr'),
+    'sway': ('config', 'sway'),
+    'awesome': ('config', 'awesome'),
+    'polybar': ('config', 'polybar'),
+    'waybar': ('config', 'waybar'),
+
+    # Applications
+    'nvim': ('config', 'nvim'),
+    'neofetch': ('config', 'neofetch'),
+    'rofi': ('config', 'rofi'),
+    'dunst': ('config', 'dunst'),
+    'picom': ('config', 'picom'),
+    'flameshot': ('config', 'flameshot'),
+
+    # Theme related
+    'gtk-3.0': ('config', 'gtk-3.0'),
+    'gtk-4.0': ('config', 'gtk-4.0'),
+    'themes': ('themes', ''),
+    'icons': ('icons', ''),
+    'wallpapers': ('wallpapers', ''),
+
+    # System configs
+    'fontconfig': ('config', 'fontconfig'),
+    'swaylock': ('config', 'swaylock'),
+    'hyprlock': ('config', 'hyprlock'),
+    'hypridle': ('config', 'hypridle'),
+}
+
+# Asset directories that should be preserved
+_ASSET_DIRS = frozenset({
+    'wallpapers', 'backgrounds', 'icons', 'themes', 'fonts', 'assets',
+    'styles', 'shaders', 'images', 'readme_resources', 'stickers'
+})
+
+# Name -> config type in one table; known config directories take precedence
+_NAME_TYPES: Dict[str, str] = {name: target[0] for name, target in _KNOWN_CONFIG_DIRS.items()}
+for _name in _ASSET_DIRS:
+    _NAME_TYPES.setdefault(_name, _name)
+del _name
+
+# Shell configuration directories
+_SHELL_CONFIG_DIRS = frozenset({
+    'plugins', 'themes', 'custom', 'lib', 'tools', 'templates'
+})
+
+# Dotfile patterns to match
+_DOTFILE_PATTERNS = (
+    r'^\.',  # Traditional dot files
+    r'^dot_',  # Chezmoi style
+    r'\.conf$',  # Configuration files
+    r'\.toml$', r'\.yaml$', r'\.yml$', r'\.json$',
+    r'rc$',  # rc files
+    r'config$',  # config files
+    r'\.nix$',  # Nix configuration files
+    r'flake\.nix$',  # Nix flakes
+    r'\.ini$',  # INI configs
+    r'\.ron$',  # RON configs
+    r'\.css$',  # Style files
+    r'\.scss$',  # SASS files
+    r'\.js$',  # JavaScript configs
+    r'\.ts$',  # TypeScript configs
+    r'zshrc$',  # Zsh config files
+    r'bashrc$',  # Bash config files
+    r'\.zsh$',  # Zsh plugin files
+    r'\.sh$'   # Shell scripts
+)
+# Every pattern above is a literal anchor, so matching is a prefix/suffix test;
+# redundant entries (flake.nix, zshrc, bashrc) are covered by shorter suffixes.
+# Known config and asset names are looked up in _NAME_TYPES before these are tried.
+_DOTFILE_PREFIXES = ('.', 'dot_')
+_DOTFILE_SUFFIXES = (
+    '.conf', '.toml', '.yaml', '.yml', '.json', 'rc', 'config', '.nix',
+    '.ini', '.ron', '.css', '.scss', '.js', '.ts', '.zsh', '.sh'
+)
+
 class DotfileNode:
-    def __init__(self, path: Path, is_dotfile: bool = False):
+    # Trees hold one node per file, so skip the per-instance __dict__
+    __slots__ = (
+        'path', 'name', 'is_dotfile', 'is_file', 'children', 'dependencies',
+        'is_nix_config', 'config_type', 'target_path'
+    )
+
+    def __init__(
+        self,
+        path: Path,
+        is_dotfile: bool = False,
+        name: Optional[str] = None,
+        is_file: Optional[bool] = None
+    ):
         self.path = path
-        self.name = path.name
+        self.name = path.name if name is None else name
         self.is_dotfile = is_dotfile
+        self.is_file = is_file  # From the directory listing; None if not yet known
         self.children = []
         self.dependencies: Set[str] = set()
         self.is_nix_config = False
@@ -25,6 +186,12 @@ class DotfileAnalyzer:
     """
     Analyzes dotfile directories to determine structure and dependencies.
     """
+    # Shared, immutable name tables defined at module level
+    known_config_dirs = _KNOWN_CONFIG_DIRS
+    asset_dirs = _ASSET_DIRS
+    shell_config_dirs = _SHELL_CONFIG_DIRS
+    dotfile_patterns = _DOTFILE_PATTERNS
+
     def __init__(self, dependency_map: Dict[str, Any], logger: Optional[logging.Logger] = None):
         """
         Initializes the DotfileAnalyzer.
@@ -35,234 +202,298 @@ class DotfileAnalyzer:
         """
         self.dependency_map = dependency_map
         self.logger = logger or logging.getLogger('DotfileManager')
-        # Precompile regex patterns
-        self.package_regex = re.compile(r'[\w-]+(?:>=?[\d.]+)?')
-        
+        self._home = Path.home()
+
         # Common configuration locations
         self.config_locations = {
-            'config': Path.home() / '.config',
-            'local': Path.home() / '.local',
-            'home': Path.home(),
-            'themes': Path.home() / '.themes',
-            'icons': Path.home() / '.icons',
-            'fonts': Path.home() / '.local/share/fonts',
-            'wallpapers': Path.home() / '.local/share/wallpapers',
+            'config': self._home / '.config',
+            'local': self._home / '.local',
+            'home': self._home,
+            'themes': self._home / '.themes',
+            'icons': self._home / '.icons',
+            'fonts': self._home / '.local/share/fonts',
+            'wallpapers': self._home / '.local/share/wallpapers',
         }
         
-        # Known configuration directories and their target locations
-        self.known_config_dirs = {
-            # Shell configs
-            'oh-my-zsh': ('home', '.oh-my-zsh'),
-            'zsh': ('home', '.zsh'),
-            'bash': ('home', '.bash'),
-            'fish': ('config', 'fish'),
-            
-            # Terminal emulators
-            'kitty': ('config', 'kitty'),
-            'alacritty': ('config', 'alacritty'),
-            'wezterm': ('config', 'wezterm'),
-            
-            # Window managers and desktop environment
-            'i3': ('config', 'i3'),
-            'hypr': ('config', 'hypr'),
-            'sway': ('config', 'sway'),
-            'awesome': ('config', 'awesome'),
-            'polybar': ('config', 'polybar'),
-            'waybar': ('config', 'waybar'),
-            
-            # Applications
-            'nvim': ('config', 'nvim'),
-            'neofetch': ('config', 'neofetch'),
-            'rofi': ('config', 'rofi'),
-            'dunst': ('config', 'dunst'),
-            'picom': ('config', 'picom'),
-            'flameshot': ('config', 'flameshot'),
-            
-            # Theme related
-            'gtk-3.0': ('config', 'gtk-3.0'),
-            'gtk-4.0': ('config', 'gtk-4.0'),
-            'themes': ('themes', ''),
-            'icons': ('icons', ''),
-            'wallpapers': ('wallpapers', ''),
-            
-            # System configs
-            'fontconfig': ('config', 'fontconfig'),
-            'swaylock': ('config', 'swaylock'),
-            'hyprlock': ('config', 'hyprlock'),
-            'hypridle': ('config', 'hypridle'),
-        }
-        
-        # Asset directories that should be preserved
-        self.asset_dirs = {
-            'wallpapers', 'backgrounds', 'icons', 'themes', 'fonts', 'assets',
-            'styles', 'shaders', 'images', 'readme_resources', 'stickers'
-        }
-        
-        # Shell configuration directories
-        self.shell_config_dirs = {
-            'plugins', 'themes', 'custom', 'lib', 'tools', 'templates'
-        }
-        
-        # Dotfile patterns to match
-        self.dotfile_patterns = [
-            r'^\.',  # Traditional dot files
-            r'^dot_',  # Chezmoi style
-            r'\.conf$',  # Configuration files
-            r'\.toml$', r'\.yaml$', r'\.yml$', r'\.json$',
-            r'rc$',  # rc files
-            r'config$',  # config files
-            r'\.nix$',  # Nix configuration files
-            r'flake\.nix$',  # Nix flakes
-            r'\.ini$',  # INI configs
-            r'\.ron$',  # RON configs
-            r'\.css$',  # Style files
-            r'\.scss$',  # SASS files
-            r'\.js$',  # JavaScript configs
-            r'\.ts$',  # TypeScript configs
-            r'zshrc$',  # Zsh config files
-            r'bashrc$',  # Bash config files
-            r'\.zsh$',  # Zsh plugin files
-            r'\.sh$'   # Shell scripts
-        ]
-
-    def build_tree(self, root_path: Path) -> DotfileNode:
+        # (path, parent_type, has_config_dir) -> (is_dotfile, config_type, target_path)
+        self._analysis_cache: Dict[Tuple[str, Optional[str], bool], Tuple[bool, Optional[str], Optional[Path]]] = {}
+
+        # lowercased name -> (type implied by the name alone, matches a dotfile pattern)
+        self._name_cache: Dict[str, Tuple[Optional[str], bool]] = {}
+
+        # parent directory -> (its components, its lowercased components)
+        self._parent_cache: Dict[str, Tuple[frozenset, frozenset]] = {}
+
+    def build_tree(self, root_path: Path, parallel: bool = True) -> DotfileNode:
         """
         Builds a tree structure of the dotfiles directory.
 
         Args:
             root_path (Path): Root path of the dotfiles.
+            parallel (bool): Build top-level subtrees concurrently.
 
         Returns:
             DotfileNode: Root node of the tree.
         """
         root = DotfileNode(root_path)
-        stack = [(root, None)]  # (node, parent_type)
+        # One stat answers both "does it exist" and "is it a directory"
+        try:
+            root_is_dir = stat.S_ISDIR(os.stat(root_path).st_mode)
+        except OSError:
+            return root
+
+        pending = self._expand_node(root, None, root_is_dir, root_path)
+        if not parallel or len(pending) <= 1:
+            self._build_subtree(pending, root_path)
+            return root
+
+        # Top-level subtrees are independent and bound by directory reads, so threads overlap the I/O
+        with ThreadPoolExecutor(max_workers=min(8, len(pending))) as executor:
+            list(executor.map(lambda item: self._build_subtree([item], root_path), pending))
+        return root
+
+    def _build_subtree(self, stack: List[Tuple[DotfileNode, Optional[str], bool]], root_path: Path) -> None:
+        """
+        Expands nodes from a worklist until the subtrees below them are complete.
 
+        Args:
+            stack (List[Tuple[DotfileNode, Optional[str], bool]]): (node, parent_type, is_dir) items.
+            root_path (Path): Root path of the dotfiles.
+        """
         while stack:
-            current_node, parent_type = stack.pop()
-            if not current_node.path.exists():
-                continue
-
-            # Determine if this is a dotfile and its type
-            is_dotfile, config_type = self._analyze_path(current_node.path, parent_type)
-            current_node.is_dotfile = is_dotfile
-            current_node.config_type = config_type
-
-            # Set target path if this is a dotfile
-            if is_dotfile:
-                current_node.target_path = self._determine_target_path(current_node.path, config_type)
-
-            if current_node.path.is_dir():
-                for item in current_node.path.iterdir():
-                    # Skip version control directories
-                    if item.name in {'.git', '.svn', '.hg'}:
-                        continue
-                    
-                    # Avoid infinite recursion with symlinks
-                    if item.is_symlink() and item.resolve().is_dir():
-                        resolved_path = item.resolve()
-                        if resolved_path.is_relative_to(root_path):
-                            continue
-                            
-                    child_node = DotfileNode(item)
-                    current_node.children.append(child_node)
-                    stack.append((child_node, config_type or current_node.config_type))
+            stack.extend(self._expand_node(*stack.pop(), root_path))
+
+    def _expand_node(
+        self,
+        current_node: DotfileNode,
+        parent_type: Optional[str],
+        is_dir: bool,
+        root_path: Path
+    ) -> List[Tuple[DotfileNode, Optional[str], bool]]:
+        """
+        Analyzes a node and attaches its children.
 
-        return root
+        Args:
+            current_node (DotfileNode): Node to analyze.
+            parent_type (Optional[str]): Configuration type of the parent directory.
+            is_dir (bool): Whether the node is a directory.
+            root_path (Path): Root path of the dotfiles.
 
-    def _analyze_path(self, path: Path, parent_type: Optional[str] = None) -> tuple[bool, Optional[str]]:
+        Returns:
+            List[Tuple[DotfileNode, Optional[str], bool]]: Children still to be expanded.
+        """
+        # List directories once; entry types come from the listing itself, and the
+        # .config probe is answered during the same pass
+        entries = []
+        has_config_dir = False
+        if is_dir:
+            # An unreadable directory becomes a leaf instead of aborting the whole walk
+            try:
+                with os.scandir(current_node.path) as it:
+                    for entry in it:
+                        name = entry.name
+                        if name in _VCS_DIRS:
+                            continue
+                        if name == '.config':
+                            has_config_dir = entry.is_dir()
+                        entries.append(entry)
+            except OSError as e:
+                self.logger.warning(f"Could not list {current_node.path}: {e}")
+                entries = []
+                has_config_dir = False
+
+        # Determine if this is a dotfile, its type and target; the analysis depends
+        # only on these inputs, so results are reused across rebuilds
+        key = (str(current_node.path), parent_type, has_config_dir)
+        analysis = self._analysis_cache.get(key)
+        if analysis is None:
+            # The node already carries its listing name; lowercase it once for both lookups
+            name = current_node.name
+            name_lower = name.lower()
+            is_dotfile, config_type = self._analyze_path(
+                current_node.path, parent_type, has_config_dir, name_lower, name
+            )
+            target_path = (
+                self._determine_target_path(current_node.path, config_type, name_lower) if is_dotfile else None
+            )
+            analysis = self._analysis_cache[key] = (is_dotfile, config_type, target_path)
+        current_node.is_dotfile, config_type, current_node.target_path = analysis
+        current_node.config_type = config_type
+
+        pending = []
+        for entry in entries:
+            child_node = DotfileNode(current_node.path / entry.name, name=entry.name)
+            if entry.is_symlink():
+                # Dangling symlinks are kept as leaves but not analyzed
+                if not os.path.exists(entry.path):
+                    current_node.children.append(child_node)
+                    continue
+                child_is_dir = entry.is_dir()
+                # Avoid infinite recursion with symlinks
+                if child_is_dir and child_node.path.resolve().is_relative_to(root_path):
+                    continue
+            else:
+                child_is_dir = entry.is_dir(follow_symlinks=False)
+            child_node.is_file = entry.is_file()
+
+            current_node.children.append(child_node)
+            pending.append((child_node, config_type, child_is_dir))
+        return pending
+
+    def _analyze_path(
+        self,
+        path: Path,
+        parent_type: Optional[str] = None,
+        has_config_dir: Optional[bool] = None,
+        name_lower: Optional[str] = None,
+        name: Optional[str] = None
+    ) -> tuple[bool, Optional[str]]:
         """
         Analyzes a path to determine if it's a dotfile and its configuration type.
 
         Args:
             path (Path): Path to analyze
             parent_type (Optional[str]): Configuration type of the parent directory
+            has_config_dir (Optional[bool]): Whether path is a directory containing .config,
+                if already known from a directory listing; probed on disk when None
+            name_lower (Optional[str]): Lowercased name of the path, derived from it when None
+            name (Optional[str]): Name of the path, derived from it when None
 
         Returns:
             tuple[bool, Optional[str]]: (is_dotfile, config_type)
         """
-        name = path.name.lower()
-        
-        # Check if it's in known config directories
-        if name in self.known_config_dirs:
-            return True, self.known_config_dirs[name][0]
-            
-        # Check if it's an asset directory
-        if name in self.asset_dirs:
-            return True, name
+        if name is None:
+            name = path.name
+        if name_lower is None:
+            name_lower = name.lower()
+        name_type, matches_pattern = self._classify_name(name_lower)
+
+        # Known config directories and asset directories are typed by name alone
+        if name_type:
+            return True, name_type
             
         # Check if it's under a known config parent
         if parent_type:
             return True, parent_type
             
-        # Check if it's a directory containing .config
-        if path.is_dir():
-            config_dir = path / '.config'
-            if config_dir.exists() and config_dir.is_dir():
-                return True, 'config'
+        # Check if it's under .config or config; this settles the result before
+        # any filesystem probe below
+        parent_parts, parent_parts_lower = self._parent_components(path)
+        if (
+            name == '.config' or name_lower == 'config'
+            or '.config' in parent_parts or 'config' in parent_parts_lower
+        ):
+            return True, 'config'
 
-        # Check if it's under .config or config
-        if '.config' in path.parts or any(part.lower() == 'config' for part in path.parts):
+        # Check if it's a directory containing .config
+        if has_config_dir is None:
+            has_config_dir = path.is_dir() and (path / '.config').is_dir()
+        if has_config_dir:
             return True, 'config'
             
         # Check if it's under .local
-        if '.local' in path.parts:
+        if name == '.local' or '.local' in parent_parts:
             return True, 'local'
             
         # Check against dotfile patterns
-        for pattern in self.dotfile_patterns:
-            if re.search(pattern, name):
-                return True, self._infer_config_type(path)
+        if matches_pattern:
+            return True, self._infer_config_type(path, name)
                 
         return False, None
 
-    def _infer_config_type(self, path: Path) -> str:
+    def _classify_name(self, name: str) -> Tuple[Optional[str], bool]:
+        """
+        Classifies a lowercased file or directory name, memoized since names recur across a tree.
+
+        Args:
+            name (str): Lowercased name to classify
+
+        Returns:
+            Tuple[Optional[str], bool]: (type implied by the name, whether it matches a dotfile
+                pattern); the patterns are only tested for names without a type, since a typed
+                name settles the analysis on its own
+        """
+        result = self._name_cache.get(name)
+        if result is None:
+            # Cheapest test first: one hash lookup, then the prefix/suffix scans
+            name_type = _NAME_TYPES.get(name)
+            result = self._name_cache[name] = (
+                name_type,
+                name_type is None and (name.startswith(_DOTFILE_PREFIXES) or name.endswith(_DOTFILE_SUFFIXES))
+            )
+        return result
+
+    def _parent_components(self, path: Path) -> Tuple[frozenset, frozenset]:
+        """
+        Returns the components of a path's parent, as-is and lowercased, memoized per
+        parent since every sibling in a directory shares them.
+
+        Args:
+            path (Path): Path whose parent components are needed
+
+        Returns:
+            Tuple[frozenset, frozenset]: (parent components, lowercased parent components)
+        """
+        key = os.path.dirname(str(path))
+        components = self._parent_cache.get(key)
+        if components is None:
+            parts = path.parent.parts
+            components = self._parent_cache[key] = (frozenset(parts), frozenset(part.lower() for part in parts))
+        return components
+
+    def _infer_config_type(self, path: Path, name: Optional[str] = None) -> str:
         """
         Infers the configuration type based on the path structure.
 
         Args:
             path (Path): Path to analyze
+            name (Optional[str]): Name of the path, derived from it when None
 
         Returns:
             str: Inferred configuration type
         """
-        parts = path.parts
+        parent_parts, parent_parts_lower = self._parent_components(path)
+        if name is None:
+            name = path.name
         
         # Check for common locations
-        if '.config' in parts:
-            return 'config'
-        if '.local' in parts:
-            return 'local'
-        if '.themes' in parts:
-            return 'themes'
-        if '.icons' in parts:
-            return 'icons'
-        if any(x.lower() in {'wallpapers', 'backgrounds'} for x in parts):
+        for marker, config_type in (('.config', 'config'), ('.local', 'local'), ('.themes', 'themes'), ('.icons', 'icons')):
+            if name == marker or marker in parent_parts:
+                return config_type
+        if name.lower() in _WALLPAPER_DIRS or not _WALLPAPER_DIRS.isdisjoint(parent_parts_lower):
             return 'wallpapers'
         
         # Default to home directory
         return 'home'
 
-    def _determine_target_path(self, source_path: Path, config_type: Optional[str]) -> Path:
+    def _determine_target_path(
+        self,
+        source_path: Path,
+        config_type: Optional[str],
+        name_lower: Optional[str] = None
+    ) -> Path:
         """
         Determines the target installation path for a dotfile.
 
         Args:
             source_path (Path): Source path of the dotfile
             config_type (Optional[str]): Type of configuration
+            name_lower (Optional[str]): Lowercased name of the source, derived from it when None
 
         Returns:
             Path: Target installation path
         """
         if not config_type:
-            return Path.home() / source_path.name
+            return self._home / source_path.name
             
-        base_path = self.config_locations.get(config_type, Path.home())
+        base_path = self.config_locations.get(config_type, self._home)
         
         # Handle known config directories
-        name = source_path.name.lower()
-        if name in self.known_config_dirs:
-            config_type, subpath = self.known_config_dirs[name]
+        if name_lower is None:
+            name_lower = source_path.name.lower()
+        known = self.known_config_dirs.get(name_lower)
+        if known:
+            config_type, subpath = known
             base_path = self.config_locations[config_type]
             if subpath:
                 return base_path / subpath
@@ -286,17 +517,36 @@ class DotfileAnalyzer:
 
     def find_dependencies(self, node: DotfileNode) -> None:
         """
-        Recursively finds dependencies in the tree.
+        Finds dependencies in the tree, parsing all of its text files concurrently.
 
         Args:
             node (DotfileNode): Node to analyze.
         """
-        if node.path.is_file():
-            dependencies = self._parse_dependencies(node.path)
-            node.dependencies.update(dependencies)
-
-        for child in node.children:
-            self.find_dependencies(child)
+        file_nodes = []
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if self._is_file(current) and not current.name.lower().endswith(_BINARY_SUFFIXES):
+                file_nodes.append(current)
+            stack.extend(current.children)
+
+        if len(file_nodes) <= 1:
+            for file_node in file_nodes:
+                file_node.dependencies.update(self._parse_dependencies(file_node.path))
+            return
+
+        # Parsing is dominated by file reads, so threads overlap the I/O across files
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(file_nodes))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(self._parse_dependencies, [n.path for n in file_nodes])
+            for file_node, dependencies in zip(file_nodes, results):
+                file_node.dependencies.update(dependencies)
+
+    def _is_file(self, node: DotfileNode) -> bool:
+        """Returns whether a node is a regular file, using the listing's answer when recorded."""
+        if node.is_file is None:
+            node.is_file = node.path.is_file()
+        return node.is_file
 
     def _parse_dependencies(self, file_path: Path) -> Set[str]:
         """
@@ -314,13 +564,19 @@ class DotfileAnalyzer:
                 dependencies = self.parse_json_dependencies(file_path)
             elif file_path.suffix == '.toml':
                 dependencies = self.parse_toml_dependencies(file_path)
-            elif file_path.suffix in ['.yaml', '.yml']:
+            elif file_path.suffix in _YAML_SUFFIXES:
                 dependencies = self.parse_yaml_dependencies(file_path)
             else:
-                content = file_path.read_text(encoding='utf-8').lower()
-                if any(indicator in content for indicator in ['requires', 'depends', 'dependencies']):
-                    packages = set(self.package_regex.findall(content))
-                    dependencies.update(packages)
+                # ASCII lowercasing plus a few substring searches is far cheaper than a
+                # case-insensitive regex scan, and most files have no keyword at all
+                content = file_path.read_bytes().lower()
+                # Every match starts with a keyword, so the regex can begin at the
+                # earliest stem instead of scanning the file from the top
+                offsets = [offset for offset in map(content.find, _DEP_KEYWORD_STEMS) if offset >= 0]
+                if offsets:
+                    dependencies.update(
+                        match.group(1).decode('ascii') for match in _DEP_RE.finditer(content, min(offsets))
+                    )
         except Exception as e:
             self.logger.warning(f"Could not analyze dependencies in {file_path}: {e}")
         return dependencies
@@ -337,9 +593,17 @@ class DotfileAnalyzer:
         """
         dependencies = set()
         try:
-            data = json.loads(file_path.read_text(encoding='utf-8'))
+            with file_path.open('rb') as f:
+                if ijson is not None and os.fstat(f.fileno()).st_size >= _JSON_STREAM_MIN_SIZE:
+                    # Keys of the dependency objects are read off the event stream,
+                    # so nothing of the document is materialized
+                    for prefix, event, value in ijson.parse(f):
+                        if event == 'map_key' and prefix in _JSON_DEP_KEYS:
+                            dependencies.add(value)
+                    return dependencies
+                data = _loads(f.read())
             if isinstance(data, dict):
-                for key in ['dependencies', 'devDependencies']:
+                for key in _JSON_DEP_KEYS:
                     if key in data and isinstance(data[key], dict):
                         dependencies.update(data[key].keys())
         except json.JSONDecodeError as e:
@@ -360,11 +624,11 @@ class DotfileAnalyzer:
         """
         dependencies = set()
         try:
-            data = toml.loads(file_path.read_text(encoding='utf-8'))
-            for section in ['dependencies', 'build-dependencies', 'dev-dependencies']:
+            data = _load_toml(file_path)
+            for section in _TOML_DEP_SECTIONS:
                 if section in data and isinstance(data[section], dict):
                     dependencies.update(data[section].keys())
-        except toml.TomlDecodeError as e:
+        except _TomlDecodeError as e:
             self.logger.warning(f"TOML decode error in {file_path}: {e}")
         except Exception as e:
             self.logger.warning(f"Error parsing TOML dependencies in {file_path}: {e}")
@@ -380,11 +644,19 @@ class DotfileAnalyzer:
         Returns:
             Set[str]: Set of dependencies found.
         """
+        # Deferred to the first YAML file; building a tree never needs PyYAML
+        import yaml
+
         dependencies = set()
         try:
-            data = yaml.safe_load(file_path.read_text(encoding='utf-8'))
+            raw = file_path.read_bytes()
+            # Most YAML configs declare no dependencies; skip parsing those entirely
+            if not any(key in raw for key in _YAML_DEP_KEYS_BYTES):
+                return dependencies
+            # LibYAML's loader when PyYAML was built with it
+            data = yaml.load(raw, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
             if isinstance(data, dict):
-                for key in ['dependencies', 'requires']:
+                for key in _YAML_DEP_KEYS:
                     if key in data:
                         if isinstance(data[key], list):
                             dependencies.update(data[key])
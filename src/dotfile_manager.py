@@ -1,17 +1,23 @@
 # src/dotfile_manager.py
 
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Any
+from typing import Dict, Iterable, List, Optional, Set, Any, Tuple
+import errno
+import os
 import subprocess
 import shutil
-import datetime
+import stat
 import time
 import re
+import selectors
 import logging
 import json
+from collections import deque
 from contextlib import contextmanager
+from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor
 
-from .config import ConfigManager, RepositoryConfig
+from .config import ConfigManager, RepositoryConfig, _loads
 from .backup import BackupManager
 from .logger import setup_logger
 from .script import ScriptRunner
@@ -32,9 +38,38 @@ from .exceptions import (
     BackupError,
 )
 from .utils import sanitize_path, create_timestamp, confirm_action
-from .package_manager import PackageManager, PackageManagerInterface
+from .package_manager import PackageManager, PackageManagerInterface, PacmanPackageManager, AptPackageManager
 from .os_manager import OSManager
 
+# Bundled dependency map, located once at import
+_DEPENDENCY_MAP_PATH = Path(__file__).parent.parent / "configs" / "dependency_map.json"
+
+# Standard XDG and dotfile directories with their categories, in discovery order
+_STANDARD_DOTFILE_DIRS: Dict[str, str] = {
+    '.config': 'config',
+    '.local': 'local',
+    '.themes': 'themes',
+    '.icons': 'icons',
+    '.walls': 'wallpapers',
+    '.wallpapers': 'wallpapers',
+    '.fonts': 'fonts',
+    '.bin': 'bin',
+    '.scripts': 'scripts',
+}
+
+# Blobless partial clone: the full commit graph is fetched, file contents only on checkout
+_GIT_CLONE_ARGS = ('git', 'clone', '--recursive', '--filter=blob:none')
+
+# Lowercased git stderr fragments mapped to the reason reported for a failed clone
+_CLONE_FAILURE_REASONS = (
+    (b'authentication failed', 'authentication failed'),
+    (b'repository not found', 'repository not found'),
+    (b'could not resolve host', 'could not resolve host'),
+)
+
+# Parsed dependency maps keyed by (path, mtime_ns)
+_DEPENDENCY_MAP_CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
 
 class DotfileManager:
     """
@@ -56,6 +91,9 @@ class DotfileManager:
             log_file (Optional[str]): Path to the log file.
         """
         self.logger = setup_logger(verbose, log_file)
+        self._home = Path.home()
+        self._config_home = self._home / '.config'
+        self._snapshots_dir = self._config_home / "riceautomator" / "snapshots"
         self.config_manager = ConfigManager(config_path=config_path, logger=self.logger)
         self.backup_manager = BackupManager(logger=self.logger)
         self.os_manager = OSManager(logger=self.logger)
@@ -64,13 +102,110 @@ class DotfileManager:
         self.script_runner = ScriptRunner(logger=self.logger)
         self.template_handler = TemplateHandler(logger=self.logger)
         self.file_ops = FileOperations(self.backup_manager, logger=self.logger)
-        self.dependency_map = self._load_dependency_map()
-        self.dotfile_analyzer = DotfileAnalyzer(self.dependency_map, logger=self.logger)
+        self._ensured_dirs: Set[Path] = set()
+        self._tree_cache: Dict[str, Tuple[Tuple[int, ...], DotfileNode, Tuple[List[Tuple[str, str]], Set[str]]]] = {}
         self.max_retries = 3
         self.retry_delay = 2  # seconds
         self.managed_rices_dir = sanitize_path("~/.config/managed-rices")
         self._ensure_managed_dir()
 
+    def _tree_signature(self, local_dir: Path) -> Tuple[int, ...]:
+        """
+        Returns a cheap change signature for a rice directory.
+
+        The directory's own mtime only changes when direct entries are added or removed,
+        so the git index mtime is included to catch pulls that rewrite nested files.
+
+        Args:
+            local_dir (Path): Root directory of the rice.
+
+        Returns:
+            Tuple[int, ...]: Modification times making up the signature.
+        """
+        signature = [os.stat(local_dir).st_mtime_ns]
+        try:
+            signature.append(os.stat(local_dir / '.git' / 'index').st_mtime_ns)
+        except OSError:
+            pass
+        return tuple(signature)
+
+    def _analyze_tree_cached(
+        self,
+        local_dir: Path
+    ) -> Tuple[DotfileNode, Tuple[List[Tuple[str, str]], Set[str]]]:
+        """
+        Builds the dotfile tree for a directory, with dependencies resolved, and indexes it,
+        reusing the previous result while the directory signature is unchanged.
+
+        Args:
+            local_dir (Path): Root directory of the rice.
+
+        Returns:
+            Tuple[DotfileNode, Tuple[List[Tuple[str, str]], Set[str]]]: Root node of the
+                analyzed tree and its index from _index_tree.
+        """
+        key = str(local_dir)
+        signature = self._tree_signature(local_dir)
+        cached = self._tree_cache.get(key)
+        if cached and cached[0] == signature:
+            self.logger.debug(f"Reusing cached dotfile tree for {local_dir}")
+            return cached[1], cached[2]
+        tree = self.dotfile_analyzer.build_tree(local_dir)
+        self.dotfile_analyzer.find_dependencies(tree)
+        index = self._index_tree(tree)
+        self._tree_cache[key] = (signature, tree, index)
+        return tree, index
+
+    def _index_tree(self, root: DotfileNode) -> Tuple[List[Tuple[str, str]], Set[str]]:
+        """
+        Collects everything apply needs from an analyzed tree in a single pre-order walk,
+        so dotfile discovery and package detection do not each traverse it.
+
+        Args:
+            root (DotfileNode): Root of a tree with dependencies resolved.
+
+        Returns:
+            Tuple[List[Tuple[str, str]], Set[str]]: Installable dotfiles as (path relative
+                to the root, category) in pre-order, and the union of all dependencies.
+        """
+        dotfiles = []
+        dependencies = set()
+        # Node paths all start with the root's own string, so slicing it off
+        # replaces a PurePath.relative_to per node
+        root_prefix_len = len(os.path.join(str(root.path), ''))
+        stack = deque([root])
+        pop, extend = stack.pop, stack.extend
+        while stack:
+            node = pop()
+            dependencies.update(node.dependencies)
+            if node.is_dotfile and node.target_path:
+                dotfiles.append((str(node.path)[root_prefix_len:] or ".", node.config_type or "config"))
+            # Reversed so nodes are visited in pre-order
+            extend(reversed(node.children))
+        return dotfiles, dependencies
+
+    @cached_property
+    def dependency_map(self) -> Dict[str, Any]:
+        """Dependency map, loaded on first use."""
+        return self._load_dependency_map()
+
+    @cached_property
+    def dotfile_analyzer(self) -> DotfileAnalyzer:
+        """Dotfile analyzer, created on first use."""
+        return DotfileAnalyzer(self.dependency_map, logger=self.logger)
+
+    def _ensure_directories(self, directories: Iterable[Path]) -> None:
+        """
+        Creates directories, skipping any this manager has already ensured.
+
+        Args:
+            directories (Iterable[Path]): Directories that must exist.
+        """
+        for directory in directories:
+            if directory not in self._ensured_dirs:
+                directory.mkdir(parents=True, exist_ok=True)
+                self._ensured_dirs.add(directory)
+
     def _ensure_managed_dir(self) -> None:
         """
         Ensures that the managed rices directory exists.
@@ -90,15 +225,20 @@ class DotfileManager:
             Dict[str, Any]: Dependency map.
         """
         try:
-            rules_path = Path(__file__).parent.parent / "configs" / "dependency_map.json"
-            if rules_path.exists():
-                with rules_path.open('r', encoding='utf-8') as f:
-                    dependency_map = json.load(f)
-                    self.logger.debug(f"Loaded dependency map from {rules_path}")
-                    return dependency_map
-            else:
+            rules_path = _DEPENDENCY_MAP_PATH
+            try:
+                key = (str(rules_path), os.stat(rules_path).st_mtime_ns)
+            except FileNotFoundError:
                 self.logger.warning(f"Dependency map not found at {rules_path}. Using empty map.")
                 return {}
+
+            # Parsed once per process while the file is unchanged
+            dependency_map = _DEPENDENCY_MAP_CACHE.get(key)
+            if dependency_map is None:
+                dependency_map = _loads(rules_path.read_bytes())
+                _DEPENDENCY_MAP_CACHE[key] = dependency_map
+                self.logger.debug(f"Loaded dependency map from {rules_path}")
+            return dependency_map
         except json.JSONDecodeError as e:
             self.logger.error(f"Invalid JSON in dependency map: {e}")
             return {}
@@ -131,10 +271,17 @@ class DotfileManager:
                 with self._transactional_operation("clone_repository"):
                     backup_id = self.backup_manager.create_backup(repository_name=repo_name, backup_name=create_timestamp())
                     self.logger.info(f"Cloning repository from {repository_url} into {local_dir}")
-                    subprocess.run(['git', 'clone', '--recursive', repository_url, str(local_dir)], check=True)
+                    subprocess.run([*_GIT_CLONE_ARGS, repository_url, str(local_dir)], check=True, stderr=subprocess.PIPE)
                     self.logger.info(f"Repository cloned successfully to: {local_dir}")
             except subprocess.CalledProcessError as e:
-                self.logger.error(f"An error occurred during clone_repository: {e}")
+                # Match on the raw bytes; the stderr blob is never decoded as a whole
+                err = (e.stderr or b'').lower()
+                reason = next((reason for marker, reason in _CLONE_FAILURE_REASONS if marker in err), None)
+                if reason:
+                    self.logger.error(f"An error occurred during clone_repository: {reason}")
+                else:
+                    details = (e.stderr or b'').decode(errors='replace').strip()
+                    self.logger.error(f"An error occurred during clone_repository: {e}" + (f": {details}" if details else ""))
                 if backup_id:
                     self.backup_manager.rollback_backup(repository_name=repo_name, backup_name=backup_id, target_dir=local_dir)
                 return False
@@ -171,7 +318,7 @@ class DotfileManager:
             repository_url = repository_url.replace('git://', 'https://')
             self.logger.debug(f"Updated repository URL to HTTPS: {repository_url}")
 
-        if not any(repository_url.startswith(prefix) for prefix in ['http://', 'https://']):
+        if not repository_url.startswith(('http://', 'https://')):
             if 'github.com' in repository_url:
                 repository_url = f'https://{repository_url}'
                 self.logger.debug(f"Updated GitHub repository URL: {repository_url}")
@@ -208,9 +355,8 @@ class DotfileManager:
         try:
             config_file = local_dir / "rice.json"
             if config_file.exists():
-                with config_file.open('r', encoding='utf-8') as f:
-                    repo_config = json.load(f)
-                    self.logger.debug(f"Loaded existing configuration from {config_file}")
+                repo_config = _loads(config_file.read_bytes())
+                self.logger.debug(f"Loaded existing configuration from {config_file}")
             else:
                 self.logger.info(f"No configuration file found in {local_dir}. Creating default configuration.")
                 repo_config = self._create_default_repo_config(repository_url, local_dir)
@@ -299,9 +445,7 @@ class DotfileManager:
 
             # 2. Create necessary directories
             config_dirs = self._get_standard_config_dirs()
-
-            for dir_path in config_dirs.values():
-                dir_path.mkdir(parents=True, exist_ok=True)
+            self._ensure_directories(config_dirs.values())
 
             # 3. Load or create repository-specific configuration
             repo_config = self.config_manager.get_repository_config(local_dir)
@@ -330,40 +474,44 @@ class DotfileManager:
                 )
                 return False
 
-            # 6. Backup existing configurations
+            # Resolve each item's target once; reused by the backup and stow passes
+            home = self._home
+            apply_plan = []
             for item_path_str, category in dotfile_dirs.items():
                 item_path = Path(item_path_str)
-                target_dir = config_dirs.get(category, Path.home())
-                target_path = target_dir / item_path.name
+                target_dir = config_dirs.get(category, home)
+                apply_plan.append((item_path, category, target_dir, target_dir / item_path.name))
 
-                if target_path.exists() or target_path.is_symlink():
-                    self._backup_existing_config(target_path)
+            # 6. Backup existing configurations
+            self._backup_existing_targets([target_path for _, _, _, target_path in apply_plan])
 
             # 7. Apply dotfiles using Stow
             stow_opts = list(stow_options) if stow_options else []
             if overwrite_symlink:
                 stow_opts.extend(['--adopt', '--no-folding'])
 
-            for item_path_str, category in dotfile_dirs.items():
-                item_path = Path(item_path_str)
-                target_dir = config_dirs.get(category, Path.home())
-
-                # Create target directory if it doesn't exist
-                target_dir.mkdir(parents=True, exist_ok=True)
-
-                # Stow item with target directory
-                if not self._stow_item(local_dir, item_path, stow_opts):
-                    self.logger.error(f"Failed to stow {item_path}. Aborting.")
-                    return False
-
-                # Record the applied item in config
-                rice_config.setdefault("dotfile_directories", {})[str(item_path)] = category
-                rice_config.setdefault("profiles", {}).setdefault("default", {}).setdefault("configs", []).append({
-                    "name": item_path.name,
-                    "path": str(target_dir / item_path.name),
-                    "type": category,
-                    "applied_at": create_timestamp(),
-                })
+            # Create target directories if they don't exist
+            self._ensure_directories(target_dir for _, _, target_dir, _ in apply_plan)
+
+            # Stow every package in one invocation; per-item stows with conflict
+            # handling are only needed when that fails
+            item_paths = [item_path for item_path, _, _, _ in apply_plan]
+            stowed_all = self._stow_all(local_dir, item_paths, stow_opts)
+            dry_runs = {}
+            if not stowed_all:
+                # Stow dry runs only read, so run one per distinct package concurrently.
+                # Real stows stay serial: concurrent stows into one target race on folding.
+                first_items = {}
+                for item_path in item_paths:
+                    first_items.setdefault(item_path.parts[0] if item_path.parts else '', item_path)
+                dry_runs = self._simulate_stows(local_dir, list(first_items.values()), stow_opts)
+
+            if not stowed_all:
+                for item_path in item_paths:
+                    # Later items of an already stowed package get a fresh dry run
+                    if not self._stow_item(local_dir, item_path, stow_opts, dry_run=dry_runs.get(item_path)):
+                        self.logger.error(f"Failed to stow {item_path}. Aborting.")
+                        return False
 
             # 8. Handle templates if requested
             if discover_templates:
@@ -375,34 +523,32 @@ class DotfileManager:
                 if not self._run_custom_scripts(local_dir, custom_scripts):
                     return False
 
-            # 10. Update rice config
-            self._update_rice_config(repository_name, rice_config)
+            # Record the applied items only once every step has succeeded; the batch
+            # writes them to disk in a single save when the block exits
+            with self.config_manager.batch_update(repository_name) as rice_config:
+                applied_at = create_timestamp()
+                for item_path, category, _, target_path in apply_plan:
+                    rice_config.setdefault("dotfile_directories", {})[str(item_path)] = category
+                    rice_config.setdefault("profiles", {}).setdefault("default", {}).setdefault("configs", []).append({
+                        "name": item_path.name,
+                        "path": str(target_path),
+                        "type": category,
+                        "applied_at": applied_at,
+                    })
+                self.config_manager.set_applied_rice(repository_name)
+
+            # 10. Rice config was saved when the batch update above completed
             return True
 
         except Exception as e:
             self.logger.error(f"Error applying dotfiles: {str(e)}")
             return False
 
-    def _get_standard_config_dirs(self) -> Dict[str, Path]:
-        """
-        Returns a dictionary of standard configuration directories.
-
-        Returns:
-            Dict[str, Path]: Mapping of directory names to their paths.
-        """
-        standard_targets = {
-            'config': Path.home() / '.config',
-            'local': Path.home() / '.local',
-            'themes': Path.home() / '.themes',
-            'icons': Path.home() / '.icons',
-            'wallpapers': Path.home() / '.local/share/wallpapers',
-            'fonts': Path.home() / '.local/share/fonts',
-            'bin': Path.home() / '.local/bin',
-            'scripts': Path.home() / '.local/bin',
-        }
-        return standard_targets
-
-    def _install_required_packages(self, local_dir: Path, repo_config: RepositoryConfig) -> bool:
+    def _install_required_packages(
+        self,
+        local_dir: Path,
+        repo_config: RepositoryConfig
+    ) -> bool:
         """
         Detects and installs required packages.
 
@@ -421,7 +567,11 @@ class DotfileManager:
                 return False
         return True
 
-    def _detect_required_packages(self, local_dir: Path, repo_config: RepositoryConfig) -> Dict[str, Set[str]]:
+    def _detect_required_packages(
+        self,
+        local_dir: Path,
+        repo_config: RepositoryConfig
+    ) -> Dict[str, Set[str]]:
         """
         Detects required packages by analyzing the dotfile tree and configuration.
         
@@ -440,32 +590,20 @@ class DotfileManager:
             'cargo': set()
         }
         
-        # Build dotfile tree
-        root = self.dotfile_analyzer.build_tree(local_dir)
-        
-        # Find dependencies in the tree
-        self.dotfile_analyzer.find_dependencies(root)
-        
-        # Traverse tree and collect dependencies
-        def collect_deps(node: DotfileNode):
-            if node.dependencies:
-                for dep in node.dependencies:
-                    # Check dependency map for package manager
-                    for pm, pkgs in self.dependency_map.items():
-                        if dep in pkgs:
-                            required_packages[pm].add(dep)
-                            break
-                    else:
-                        # If not found in map, default to system package manager
-                        if self.package_manager.manager.name == 'pacman':
-                            required_packages['pacman'].add(dep)
-                        else:
-                            required_packages['apt'].add(dep)
-                            
-            for child in node.children:
-                collect_deps(child)
-        
-        collect_deps(root)
+        # The tree index already holds each dependency once, however many files declare it
+        _, tree_dependencies = self._analyze_tree_cached(local_dir)
+        for dep in tree_dependencies:
+            # Check dependency map for package manager
+            for pm, pkgs in self.dependency_map.items():
+                if dep in pkgs:
+                    required_packages[pm].add(dep)
+                    break
+            else:
+                # If not found in map, default to system package manager
+                if self.package_manager.manager.name == 'pacman':
+                    required_packages['pacman'].add(dep)
+                else:
+                    required_packages['apt'].add(dep)
         
         # Add dependencies from repo config
         if repo_config and repo_config.config:
@@ -510,35 +648,34 @@ class DotfileManager:
             'system': {
                 'hostname': os.uname().nodename,
                 'username': os.getlogin(),
-                'home': str(Path.home()),
-                'config_home': str(Path.home() / '.config'),
-                'local_home': str(Path.home() / '.local'),
-                'xdg_data_home': os.environ.get('XDG_DATA_HOME', str(Path.home() / '.local/share')),
-                'xdg_config_home': os.environ.get('XDG_CONFIG_HOME', str(Path.home() / '.config')),
-                'xdg_cache_home': os.environ.get('XDG_CACHE_HOME', str(Path.home() / '.cache')),
+                'home': str(self._home),
+                'config_home': str(self._config_home),
+                'local_home': str(self._home / '.local'),
+                'xdg_data_home': os.environ.get('XDG_DATA_HOME', str(self._home / '.local/share')),
+                'xdg_config_home': os.environ.get('XDG_CONFIG_HOME', str(self._config_home)),
+                'xdg_cache_home': os.environ.get('XDG_CACHE_HOME', str(self._home / '.cache')),
             },
             'paths': {
                 'templates': str(template_dir),
-                'config': str(Path.home() / '.config'),
-                'local': str(Path.home() / '.local'),
-                'home': str(Path.home()),
+                'config': str(self._config_home),
+                'local': str(self._home / '.local'),
+                'home': str(self._home),
             }
         }
         
         try:
             # Create a backup of existing templates
-            target_template_dir = Path.home() / ".config"
-            template_files = list(template_dir.rglob('*'))
-            
-            for template in template_files:
-                if template.is_file():
-                    rel_path = template.relative_to(template_dir)
-                    target_path = target_template_dir / rel_path.with_suffix('')
+            target_template_dir = self._config_home
+
+            timestamp = create_timestamp()
+            for root, _, files in os.walk(template_dir):
+                rel_root = Path(root).relative_to(template_dir)
+                for name in files:
+                    target_path = target_template_dir / (rel_root / name).with_suffix('')
                     
-                    if target_path.exists():
-                        backup_path = self._backup_existing_config(target_path)
-                        if backup_path:
-                            self.logger.info(f"Backed up existing template at {target_path} to {backup_path}")
+                    backup_path = self._backup_existing_config(target_path, timestamp)
+                    if backup_path:
+                        self.logger.info(f"Backed up existing template at {target_path} to {backup_path}")
                             
             # Render templates with enhanced context
             if not self.template_handler.render_templates(
@@ -565,12 +702,12 @@ class DotfileManager:
             Optional[str]: Name of the current rice if exists, else None.
         """
         try:
-            for repo_name, config in self.config_manager.config_data.get('rices', {}).items():
-                if config.get('applied', False):
-                    self.logger.debug(f"Current rice is: {repo_name}")
-                    return repo_name
-            self.logger.debug("No current rice found.")
-            return None
+            repo_name = self.config_manager.get_applied_rice()
+            if repo_name:
+                self.logger.debug(f"Current rice is: {repo_name}")
+            else:
+                self.logger.debug("No current rice found.")
+            return repo_name
         except Exception as e:
             self.logger.error(f"Error retrieving current rice: {e}")
             return None
@@ -714,8 +851,8 @@ class DotfileManager:
             bool: True if successful, False otherwise.
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                import_data = json.load(f)
+            with open(file_path, 'rb') as f:
+                import_data = _loads(f.read())
 
             repository_name = new_name if new_name else import_data.get('repository_name')
             repository_url = import_data.get('repository_url')
@@ -731,22 +868,23 @@ class DotfileManager:
                 self.logger.error("Repository URL is missing in the import file.")
                 return False
 
-            # Clone the repository
-            success = self.clone_repository(repository_url)
-            if not success:
-                self.logger.error(f"Failed to clone repository '{repository_url}'.")
-                return False
+            # Clone and record the configuration; both config updates are written once
+            with self.config_manager.batch_update():
+                success = self.clone_repository(repository_url)
+                if not success:
+                    self.logger.error(f"Failed to clone repository '{repository_url}'.")
+                    return False
 
-            # Update configuration
-            self.config_manager.add_rice_config(repository_name, {
-                'repository_url': repository_url,
-                'local_directory': str(self.managed_rices_dir / repository_name),
-                'profiles': profiles,
-                'active_profile': active_profile,
-                'applied': applied,
-                'timestamp': timestamp,
-                'nix_config': nix_config
-            })
+                # Update configuration
+                self.config_manager.add_rice_config(repository_name, {
+                    'repository_url': repository_url,
+                    'local_directory': str(self.managed_rices_dir / repository_name),
+                    'profiles': profiles,
+                    'active_profile': active_profile,
+                    'applied': applied,
+                    'timestamp': timestamp,
+                    'nix_config': nix_config
+                })
 
             # Install dependencies if not skipped
             if not skip_deps and dependencies:
@@ -776,32 +914,227 @@ class DotfileManager:
             self.logger.error(f"Failed to import configuration: {e}")
             return False
 
-    def _backup_existing_config(self, target_path: Path) -> Optional[Path]:
+    def _backup_existing_config(self, target_path: Path, timestamp: Optional[str] = None) -> Optional[Path]:
         """
         Backs up an existing configuration file or directory.
 
         Args:
             target_path (Path): Path to the existing config.
+            timestamp (Optional[str]): Backup suffix stamp shared by a batch of backups;
+                a fresh one is created if not given.
 
         Returns:
             Optional[Path]: Path to the backup if created, else None.
         """
-        if target_path.exists() or target_path.is_symlink():
-            backup_path = target_path.with_suffix(f'.bak.{create_timestamp()}')
+        # One lstat answers both "does it exist" and "is it a symlink", dangling links included
+        try:
+            st = os.lstat(target_path)
+        except FileNotFoundError:
+            return None
+        backup_path = target_path.with_name(f'{target_path.name}.bak.{timestamp or create_timestamp()}')
+        try:
+            if stat.S_ISLNK(st.st_mode):
+                target_path.unlink()
+                self.logger.info(f"Removed existing symlink: {target_path}")
+            else:
+                # A rename within the same directory, so the config is never half-moved;
+                # only a target that is itself a mount point needs the copying fallback
+                try:
+                    os.replace(target_path, backup_path)
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        raise
+                    shutil.move(target_path, backup_path)
+                self.logger.info(f"Backed up existing config to {backup_path}")
+            return backup_path
+        except Exception as e:
+            self.logger.error(f"Failed to backup {target_path}: {e}")
+            raise FileOperationError(f"Failed to backup {target_path}: {e}")
+
+    def _backup_existing_targets(self, target_paths: List[Path]) -> None:
+        """
+        Backs up existing targets concurrently, since each backup is an independent I/O task.
+
+        Args:
+            target_paths (List[Path]): Target paths to back up if they exist.
+
+        Raises:
+            FileOperationError: If any backup fails, after all backups have been attempted.
+        """
+        existing = [path for path in dict.fromkeys(target_paths) if os.path.lexists(path)]
+        if not existing:
+            return
+
+        # Every backup of one run shares a stamp
+        timestamp = create_timestamp()
+
+        def backup_one(target_path: Path) -> Optional[Exception]:
             try:
-                if target_path.is_symlink():
-                    target_path.unlink()
-                    self.logger.info(f"Removed existing symlink: {target_path}")
-                else:
-                    shutil.move(str(target_path), str(backup_path))
-                    self.logger.info(f"Backed up existing config to {backup_path}")
-                return backup_path
+                self._backup_existing_config(target_path, timestamp)
+                return None
+            except FileOperationError as e:
+                return e
+
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(existing))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            errors = [error for error in executor.map(backup_one, existing) if error]
+
+        if errors:
+            raise errors[0]
+
+    def _stow_base_command(self, stow_options: List[str]) -> List[str]:
+        """
+        Builds the stow command prefix shared by every invocation.
+
+        Verbose stow output is only requested when debug logging would show it.
+
+        Args:
+            stow_options (List[str]): Additional options for stow.
+
+        Returns:
+            List[str]: The command without package arguments.
+        """
+        cmd = ['stow', '--target', str(self._home)]
+        if self.logger.isEnabledFor(logging.DEBUG):
+            cmd.insert(1, '--verbose=2')
+        cmd.extend(stow_options)
+        return cmd
+
+    def _run_stow(self, cmd: List[str], local_dir: Path) -> subprocess.CompletedProcess:
+        """
+        Runs a stow command from local_dir.
+
+        stdout is discarded; stderr is kept since it carries conflicts and errors.
+
+        Args:
+            cmd (List[str]): The stow command.
+            local_dir (Path): Base directory containing the dotfiles.
+
+        Returns:
+            subprocess.CompletedProcess: The finished process.
+        """
+        return subprocess.run(cmd, cwd=local_dir, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+
+    def _stow_command(self, local_dir: Path, item_path: Path, stow_options: List[str]) -> List[str]:
+        """
+        Builds the stow command for an item, run from local_dir.
+
+        Args:
+            local_dir (Path): Base directory containing the dotfiles.
+            item_path (Path): Path to the item to stow, relative to local_dir or absolute
+                within it.
+            stow_options (List[str]): Additional options for stow.
+
+        Returns:
+            List[str]: The stow command.
+
+        Raises:
+            ValueError: If the item lies outside local_dir or names local_dir itself.
+        """
+        cmd = self._stow_base_command(stow_options)
+
+        # Add source directory; discovered items are already relative to local_dir
+        relative_path = item_path.relative_to(local_dir) if item_path.is_absolute() else item_path
+        if not relative_path.parts:
+            raise ValueError(f"No stow package for {item_path} in {local_dir}")
+        cmd.append(relative_path.parts[0])
+        return cmd
+
+    def _stow_all(self, local_dir: Path, item_paths: List[Path], stow_options: List[str]) -> bool:
+        """
+        Stows the packages of all items with a single stow invocation.
+
+        Args:
+            local_dir (Path): Base directory containing the dotfiles.
+            item_paths (List[Path]): Paths to the items to stow, relative to local_dir.
+            stow_options (List[str]): Additional options for stow.
+
+        Returns:
+            bool: True if every package was stowed, False if any conflict or error
+                means the items need to be stowed one by one.
+        """
+        try:
+            packages = list(dict.fromkeys(
+                self._stow_command(local_dir, item_path, stow_options)[-1] for item_path in item_paths
+            ))
+            cmd = self._stow_base_command(stow_options) + packages
+
+            result = self._run_stow(cmd + ['--simulate'], local_dir)
+            if result.returncode != 0:
+                self.logger.warning(f"Batched stow dry-run failed, stowing items individually: {result.stderr}")
+                return False
+
+            result = self._run_stow(cmd, local_dir)
+            if result.returncode != 0:
+                self.logger.warning(f"Batched stow failed, stowing items individually: {result.stderr}")
+                return False
+        except Exception as e:
+            self.logger.warning(f"Batched stow unavailable, stowing items individually: {e}")
+            return False
+
+        self.logger.info(f"Successfully stowed {', '.join(packages)}")
+        return True
+
+    def _simulate_stows(
+        self,
+        local_dir: Path,
+        item_paths: List[Path],
+        stow_options: List[str]
+    ) -> Dict[Path, Optional[subprocess.CompletedProcess]]:
+        """
+        Runs the stow dry runs for several items at once.
+
+        Dry runs only read, so they are all started together; their stderr pipes are
+        drained from this thread with a selector instead of one thread per process.
+
+        Args:
+            local_dir (Path): Base directory containing the dotfiles.
+            item_paths (List[Path]): Paths to the items, relative to local_dir.
+            stow_options (List[str]): Additional options for stow.
+
+        Returns:
+            Dict[Path, Optional[subprocess.CompletedProcess]]: Dry run result per item,
+                or None where it could not run.
+        """
+        results: Dict[Path, Optional[subprocess.CompletedProcess]] = dict.fromkeys(item_paths)
+        procs = {}
+        for item_path in item_paths:
+            try:
+                cmd = self._stow_command(local_dir, item_path, stow_options) + ['--simulate']
+                procs[item_path] = subprocess.Popen(
+                    cmd, cwd=local_dir, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+                )
             except Exception as e:
-                self.logger.error(f"Failed to backup {target_path}: {e}")
-                raise FileOperationError(f"Failed to backup {target_path}: {e}")
-        return None
+                # Left as None, so _stow_item runs and reports its own dry run
+                self.logger.warning(f"Could not start stow dry-run for {item_path}: {e}")
+                continue
+
+        stderr = {item_path: [] for item_path in procs}
+        with selectors.DefaultSelector() as selector:
+            for item_path, proc in procs.items():
+                selector.register(proc.stderr, selectors.EVENT_READ, item_path)
+            while selector.get_map():
+                for key, _ in selector.select():
+                    chunk = os.read(key.fd, 65536)
+                    if chunk:
+                        stderr[key.data].append(chunk)
+                    else:
+                        selector.unregister(key.fileobj)
+                        key.fileobj.close()
+
+        for item_path, proc in procs.items():
+            results[item_path] = subprocess.CompletedProcess(
+                proc.args, proc.wait(), None, b''.join(stderr[item_path]).decode('utf-8', 'replace')
+            )
+        return results
 
-    def _stow_item(self, local_dir: Path, item_path: Path, stow_options: List[str]) -> bool:
+    def _stow_item(
+        self,
+        local_dir: Path,
+        item_path: Path,
+        stow_options: List[str],
+        dry_run: Optional[subprocess.CompletedProcess] = None
+    ) -> bool:
         """
         Applies a single item using GNU Stow with improved error handling and conflict resolution.
 
@@ -809,49 +1142,44 @@ class DotfileManager:
             local_dir (Path): Base directory containing the dotfiles.
             item_path (Path): Path to the item to stow, relative to local_dir.
             stow_options (List[str]): Additional options for stow.
+            dry_run (Optional[subprocess.CompletedProcess]): Result of an earlier
+                _simulate_stows for this item; the dry run is performed here when None.
 
         Returns:
             bool: True if successful, False otherwise.
         """
         try:
             # Prepare stow command
-            cmd = ['stow', '--verbose=2', '--target', str(Path.home())]
-            cmd.extend(stow_options)
-            
-            # Add source directory
-            relative_path = item_path.relative_to(local_dir)
-            source_dir = local_dir / relative_path.parts[0]
-            cmd.append(str(relative_path.parts[0]))
-            
-            # Change to local directory
-            with self._change_dir(local_dir):
-                # First try a dry run to detect conflicts
-                dry_run_cmd = cmd + ['--simulate']
-                result = subprocess.run(dry_run_cmd, capture_output=True, text=True)
-                
-                if result.returncode != 0:
-                    # Check for common issues
-                    if "existing target is" in result.stderr:
-                        self.logger.warning(f"Conflict detected for {item_path}")
-                        if '--adopt' not in stow_options:
-                            backup_path = self._backup_existing_config(Path.home() / item_path.name)
-                            if backup_path:
-                                self.logger.info(f"Backed up existing config to {backup_path}")
-                            else:
-                                return False
-                    else:
-                        self.logger.error(f"Stow dry-run failed: {result.stderr}")
-                        return False
-                
-                # Proceed with actual stow
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                if result.returncode != 0:
-                    self.logger.error(f"Stow failed: {result.stderr}")
+            cmd = self._stow_command(local_dir, item_path, stow_options)
+
+            # First try a dry run to detect conflicts
+            result = dry_run
+            if result is None:
+                result = self._run_stow(cmd + ['--simulate'], local_dir)
+
+            if result.returncode != 0:
+                # Check for common issues
+                if "existing target is" in result.stderr:
+                    self.logger.warning(f"Conflict detected for {item_path}")
+                    if '--adopt' not in stow_options:
+                        backup_path = self._backup_existing_config(self._home / item_path.name)
+                        if backup_path:
+                            self.logger.info(f"Backed up existing config to {backup_path}")
+                        else:
+                            return False
+                else:
+                    self.logger.error(f"Stow dry-run failed: {result.stderr}")
                     return False
-                
-                self.logger.info(f"Successfully stowed {item_path}")
-                return True
-                
+
+            # Proceed with actual stow
+            result = self._run_stow(cmd, local_dir)
+            if result.returncode != 0:
+                self.logger.error(f"Stow failed: {result.stderr}")
+                return False
+
+            self.logger.info(f"Successfully stowed {item_path}")
+            return True
+
         except subprocess.CalledProcessError as e:
             self.logger.error(f"Stow command failed: {e}")
             return False
@@ -894,23 +1222,15 @@ class DotfileManager:
         self.logger.info(f"Discovering dotfiles in {local_dir}")
         dotfile_dirs = {}
 
-        # Standard XDG and dotfile directories with their categories
-        standard_dirs = {
-            '.config': 'config',
-            '.local': 'local',
-            '.themes': 'themes',
-            '.icons': 'icons',
-            '.walls': 'wallpapers',
-            '.wallpapers': 'wallpapers',
-            '.fonts': 'fonts',
-            '.bin': 'bin',
-            '.scripts': 'scripts',
-        }
-
-        # First, check for standard directories
-        for dir_name, category in standard_dirs.items():
-            dir_path = local_dir / dir_name
-            if dir_path.exists() and dir_path.is_dir():
+        # First, check for standard directories; one listing answers every probe,
+        # and only entries with a standard name are ever stat'ed
+        try:
+            with os.scandir(local_dir) as it:
+                top_level_dirs = {entry.name for entry in it if entry.name in _STANDARD_DOTFILE_DIRS and entry.is_dir()}
+        except OSError:
+            top_level_dirs = set()
+        for dir_name, category in _STANDARD_DOTFILE_DIRS.items():
+            if dir_name in top_level_dirs:
                 dotfile_dirs[dir_name] = category
                 self.logger.info(f"Found standard dotfile directory: {dir_name} ({category})")
 
@@ -936,20 +1256,13 @@ class DotfileManager:
 
         # If still no dotfiles found, use DotfileAnalyzer as fallback
         if not dotfile_dirs:
-            root_node = self.dotfile_analyzer.build_tree(local_dir)
-
-            def traverse(node: DotfileNode) -> None:
-                if node.is_dotfile:
-                    # Get the target path where this dotfile should be installed
-                    if node.target_path:
-                        relative_path = node.path.relative_to(local_dir)
-                        dotfile_dirs[str(relative_path)] = node.config_type or "config"
-                        self.logger.debug(f"Found dotfile: {relative_path} of type {node.config_type}")
-
-                for child in node.children:
-                    traverse(child)
-
-            traverse(root_node)
+            # Dotfiles with a target path were collected when the tree was indexed
+            indexed_dotfiles, _ = self._analyze_tree_cached(local_dir)
+            debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+            for relative_path, category in indexed_dotfiles:
+                dotfile_dirs[relative_path] = category
+                if debug_enabled:
+                    self.logger.debug(f"Found dotfile: {relative_path} of type {category}")
 
         if not dotfile_dirs:
             self.logger.warning(
@@ -969,17 +1282,23 @@ class DotfileManager:
         Returns a dictionary of standard configuration directories.
 
         Returns:
-            Dict[str, Path]: Mapping of directory names to their paths.
+            Dict[str, Path]: Mapping of directory names to their paths; shared across calls,
+                so callers must not modify it.
         """
+        return self._standard_config_dirs
+
+    @cached_property
+    def _standard_config_dirs(self) -> Dict[str, Path]:
+        """Standard configuration directories, built from the home directory on first use."""
         return {
-            'config': Path.home() / '.config',
-            'local': Path.home() / '.local',
-            'themes': Path.home() / '.themes',
-            'icons': Path.home() / '.icons',
-            'wallpapers': Path.home() / '.local/share/wallpapers',
-            'fonts': Path.home() / '.local/share/fonts',
-            'bin': Path.home() / '.local/bin',
-            'scripts': Path.home() / '.local/bin',
+            'config': self._config_home,
+            'local': self._home / '.local',
+            'themes': self._home / '.themes',
+            'icons': self._home / '.icons',
+            'wallpapers': self._home / '.local/share/wallpapers',
+            'fonts': self._home / '.local/share/fonts',
+            'bin': self._home / '.local/bin',
+            'scripts': self._home / '.local/bin',
         }
 
     def _install_packages(self, packages: Dict[str, Set[str]]) -> bool:
@@ -995,7 +1314,7 @@ class DotfileManager:
         try:
             # Update package databases if necessary
             if 'pacman' in packages and isinstance(self.package_manager.manager, PacmanPackageManager):
-                pacman_packages = list(packages['pacman'])
+                pacman_packages = sorted(packages['pacman'])
                 if pacman_packages:
                     self.logger.info(f"Installing pacman packages: {', '.join(pacman_packages)}")
                     if not self.package_manager.install_packages(pacman_packages):
@@ -1003,7 +1322,7 @@ class DotfileManager:
                         return False
 
             if 'aur' in packages and self.aur_helper_manager:
-                aur_packages = list(packages['aur'])
+                aur_packages = sorted(packages['aur'])
                 if aur_packages:
                     self.logger.info(f"Installing AUR packages: {', '.join(aur_packages)}")
                     if not self.aur_helper_manager.install_packages(aur_packages):
@@ -1011,7 +1330,7 @@ class DotfileManager:
                         return False
 
             if 'apt' in packages and isinstance(self.package_manager.manager, AptPackageManager):
-                apt_packages = list(packages['apt'])
+                apt_packages = sorted(packages['apt'])
                 if apt_packages:
                     self.logger.info(f"Installing apt packages: {', '.join(apt_packages)}")
                     if not self.package_manager.install_packages(apt_packages):
@@ -1038,7 +1357,7 @@ class DotfileManager:
             bool: True if successful, False otherwise.
         """
         try:
-            snapshots_dir = Path.home() / ".config" / "riceautomator" / "snapshots"
+            snapshots_dir = self._snapshots_dir
             snapshots_dir.mkdir(parents=True, exist_ok=True)
             snapshot_path = snapshots_dir / name
 
@@ -1070,6 +1389,22 @@ class DotfileManager:
             self.logger.error(f"Failed to create snapshot '{name}': {e}")
             return False
 
+    def _check_installed_packages(self, packages: List[str]) -> Set[str]:
+        """
+        Checks which of the given packages are installed, with one package manager query.
+
+        Args:
+            packages (List[str]): Package names to check.
+
+        Returns:
+            Set[str]: The installed packages.
+        """
+        try:
+            return self.package_manager.installed_packages(packages)
+        except Exception as e:
+            self.logger.warning(f"Failed to check installed packages: {e}")
+            return set()
+
     def _get_installed_packages(self) -> Dict[str, List[str]]:
         """
         Retrieves the list of installed packages for different package managers.
@@ -1079,25 +1414,37 @@ class DotfileManager:
         """
         installed_packages: Dict[str, List[str]] = {}
         try:
+            queries = {}
             # Example for Pacman
             if isinstance(self.package_manager.manager, PacmanPackageManager):
-                result = subprocess.run(['pacman', '-Qq'], capture_output=True, text=True)
-                if result.returncode == 0:
-                    installed_packages['pacman'] = result.stdout.strip().split('\n')
+                queries['pacman'] = ['pacman', '-Qq']
 
             # Example for AUR helper
             if self.aur_helper_manager and shutil.which(self.aur_helper_manager.helper_name):
-                result = subprocess.run([self.aur_helper_manager.helper_name, '-Qq'], capture_output=True, text=True)
-                if result.returncode == 0:
-                    installed_packages['aur'] = result.stdout.strip().split('\n')
+                queries['aur'] = [self.aur_helper_manager.helper_name, '-Qq']
 
             # Example for Apt
             if isinstance(self.package_manager.manager, AptPackageManager):
-                result = subprocess.run(['dpkg-query', '-f', '${binary:Package}\n', '-W'], capture_output=True, text=True)
-                if result.returncode == 0:
-                    installed_packages['apt'] = result.stdout.strip().split('\n')
+                queries['apt'] = ['dpkg-query', '-f', '${binary:Package}\n', '-W']
 
             # Add other package managers as needed
+            if not queries:
+                return installed_packages
+
+            # Each query is a separate process that mostly waits on the package database,
+            # so they run side by side instead of one after another
+            def query(cmd: List[str]) -> Optional[subprocess.CompletedProcess]:
+                try:
+                    return subprocess.run(cmd, capture_output=True, text=True)
+                except (OSError, subprocess.SubprocessError) as e:
+                    self.logger.warning(f"Failed to run {cmd[0]} while retrieving installed packages: {e}")
+                    return None
+
+            with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+                results = dict(zip(queries, executor.map(query, queries.values())))
+            for manager_name, result in results.items():
+                if result is not None and result.returncode == 0:
+                    installed_packages[manager_name] = result.stdout.strip().split('\n')
             return installed_packages
         except subprocess.SubprocessError as e:
             self.logger.warning(f"Subprocess error while retrieving installed packages: {e}")
@@ -1127,12 +1474,12 @@ class DotfileManager:
             bool: True if successful, False otherwise.
         """
         try:
-            snapshots_dir = Path.home() / ".config" / "riceautomator" / "snapshots"
-            if not snapshots_dir.exists():
-                self.logger.info("No snapshots found.")
-                return True
-
-            snapshots = [snapshot.name for snapshot in snapshots_dir.iterdir() if snapshot.is_dir()]
+            snapshots_dir = self._snapshots_dir
+            try:
+                with os.scandir(snapshots_dir) as it:
+                    snapshots = [entry.name for entry in it if entry.is_dir()]
+            except FileNotFoundError:
+                snapshots = []
             if not snapshots:
                 self.logger.info("No snapshots found.")
                 return True
@@ -1156,7 +1503,7 @@ class DotfileManager:
             bool: True if successful, False otherwise.
         """
         try:
-            snapshots_dir = Path.home() / ".config" / "riceautomator" / "snapshots"
+            snapshots_dir = self._snapshots_dir
             snapshot_path = snapshots_dir / name
 
             if not snapshot_path.exists():
@@ -1166,8 +1513,7 @@ class DotfileManager:
             # Implement snapshot restoration logic here
             metadata_file = snapshot_path / "metadata.json"
             if metadata_file.exists():
-                with open(metadata_file, 'r', encoding='utf-8') as f:
-                    metadata = json.load(f)
+                metadata = _loads(metadata_file.read_bytes())
                 self.config_manager.config_data = metadata.get('configurations', {})
                 self.config_manager.save_config()
                 self.logger.info(f"Configurations restored from snapshot '{name}'.")
@@ -1192,7 +1538,7 @@ class DotfileManager:
             bool: True if successful, False otherwise.
         """
         try:
-            snapshots_dir = Path.home() / ".config" / "riceautomator" / "snapshots"
+            snapshots_dir = self._snapshots_dir
             snapshot_path = snapshots_dir / name
 
             if not snapshot_path.exists():
@@ -1213,7 +1559,8 @@ class DotfileManager:
         self,
         profile_name: str,
         target_files: List[str],
-        dry_run: bool = False
+        dry_run: bool = False,
+        link_mode: str = 'copy'
     ) -> bool:
         """
         Manages specific dotfiles by applying or unlinking them.
@@ -1222,6 +1569,7 @@ class DotfileManager:
             profile_name (str): Name of the profile to manage.
             target_files (List[str]): List of dotfiles to manage.
             dry_run (bool): If True, preview changes without applying.
+            link_mode (str): How directory contents are placed; see FileOperations.copy_files.
 
         Returns:
             bool: True if successful, False otherwise.
@@ -1243,27 +1591,43 @@ class DotfileManager:
                     self.logger.info(f"[Dry Run] Would manage: {file}")
                 return True
 
-            # Implement actual management logic
+            # Backups run first and in order, so the moves and their log lines stay
+            # sequential; the copies are independent and then run concurrently
+            timestamp = create_timestamp()
+            repo_dir = self.managed_rices_dir / current_repo
+            copy_plan = []
             for file in target_files:
                 self.logger.info(f"Managing dotfile: {file}")
-                target_path = Path.home() / file
-                if target_path.exists() or target_path.is_symlink():
-                    self._backup_existing_config(target_path)
+                target_path = self._home / file
+                self._backup_existing_config(target_path, timestamp)
 
                 # Assuming copying from managed directory
-                source_path = self.managed_rices_dir / current_repo / file
-                if source_path.exists():
-                    try:
-                        if source_path.is_dir():
-                            shutil.copytree(source_path, target_path, dirs_exist_ok=True)
-                        else:
-                            shutil.copy2(source_path, target_path)
-                        self.logger.info(f"Copied {source_path} to {target_path}")
-                    except Exception as e:
-                        self.logger.error(f"Failed to copy {source_path} to {target_path}: {e}")
-                        return False
-                else:
+                source_path = repo_dir / file
+                try:
+                    source_is_dir = stat.S_ISDIR(os.stat(source_path).st_mode)
+                except (FileNotFoundError, NotADirectoryError):
                     self.logger.warning(f"Source file {source_path} does not exist. Skipping.")
+                    continue
+                copy_plan.append((source_path, target_path, source_is_dir))
+
+            def copy_one(source_path: Path, target_path: Path, source_is_dir: bool) -> bool:
+                try:
+                    if source_is_dir:
+                        return self.file_ops.copy_files(source_path, target_path, link_mode=link_mode)
+                    shutil.copy2(source_path, target_path)
+                    return True
+                except Exception as e:
+                    self.logger.error(f"Failed to copy {source_path} to {target_path}: {e}")
+                    return False
+
+            if copy_plan:
+                with ThreadPoolExecutor(max_workers=min(8, len(copy_plan))) as executor:
+                    results = list(executor.map(lambda plan: copy_one(*plan), copy_plan))
+                for (source_path, target_path, _), copied in zip(copy_plan, results):
+                    if copied:
+                        self.logger.info(f"Copied {source_path} to {target_path}")
+                if not all(results):
+                    return False
 
             self.logger.info(f"Successfully managed dotfiles for profile '{profile_name}'.")
             return True
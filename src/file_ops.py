@@ -1,11 +1,38 @@
 # dotfilemanager/file_ops.py
 
+import os
 import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Callable, Any, List, Dict
+from typing import Optional, Callable, Any, List, Dict, Iterator
 import logging
 
 from .exceptions import FileOperationError
+from .utils import fast_copy, link_or_copy, same_filesystem, symlink_file
+
+# Per-file copy functions for FileOperations.copy_files link modes
+_COPY_FUNCTIONS: Dict[str, Callable[[str, str], Any]] = {
+    'copy': shutil.copy2,
+    'hardlink': link_or_copy,
+    'reflink': fast_copy,
+    'symlink': symlink_file,
+}
+
+def _iter_files_with_suffix(root: Path, suffix: str) -> Iterator[os.DirEntry]:
+    """
+    Yields files under root whose name ends with suffix, without following symlinked directories.
+
+    Uses os.scandir so file type checks come from the directory listing instead of extra stat calls.
+    """
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(suffix):
+                    yield entry
 
 class FileOperations:
     """
@@ -22,7 +49,13 @@ class FileOperations:
         self.backup_manager = backup_manager
         self.logger = logger or logging.getLogger('DotfileManager')
 
-    def copy_files(self, source_dir: Path, target_dir: Path, backup_id: Optional[str] = None) -> bool:
+    def copy_files(
+        self,
+        source_dir: Path,
+        target_dir: Path,
+        backup_id: Optional[str] = None,
+        link_mode: str = 'copy'
+    ) -> bool:
         """
         Copies files from source to target directory.
 
@@ -30,6 +63,11 @@ class FileOperations:
             source_dir (Path): Source directory.
             target_dir (Path): Target directory.
             backup_id (Optional[str]): Backup identifier.
+            link_mode (str): How each file is placed: 'copy' for a regular copy,
+                'hardlink' to hardlink files when source and target share a filesystem
+                (copying otherwise), 'reflink' for a kernel-side copy that shares blocks
+                where the filesystem supports it, or 'symlink' to link every file back
+                to the source.
 
         Returns:
             bool: True if successful, False otherwise.
@@ -38,13 +76,53 @@ class FileOperations:
             if not source_dir.exists():
                 self.logger.error(f"Source directory does not exist: {source_dir}")
                 return False
-            shutil.copytree(source_dir, target_dir, dirs_exist_ok=True)
+            if link_mode not in _COPY_FUNCTIONS:
+                self.logger.error(f"Unknown link mode '{link_mode}' for {source_dir}")
+                return False
+            if link_mode == 'hardlink' and not same_filesystem(source_dir, target_dir):
+                self.logger.debug(f"{source_dir} and {target_dir} are on different filesystems; copying")
+                link_mode = 'copy'
+            copy_function = _COPY_FUNCTIONS[link_mode]
+            self._parallel_copytree(source_dir, target_dir, copy_function)
             self.logger.info(f"Copied files from {source_dir} to {target_dir}")
             return True
         except Exception as e:
             self.logger.error(f"Failed to copy files from {source_dir} to {target_dir}: {e}")
             return False
 
+    def _parallel_copytree(self, source_dir: Path, target_dir: Path, copy_function: Callable[[str, str], Any]) -> None:
+        """
+        Copies a directory tree by creating the directory skeleton first, then copying files in parallel.
+
+        Args:
+            source_dir (Path): Directory to copy from.
+            target_dir (Path): Directory to copy into; existing directories are reused.
+            copy_function (Callable[[str, str], Any]): Per-file copy function, as for shutil.copytree.
+        """
+        copies = []
+        os.makedirs(target_dir, exist_ok=True)
+        stack = [(str(source_dir), str(target_dir))]
+        while stack:
+            src_root, dest_root = stack.pop()
+            with os.scandir(src_root) as it:
+                for entry in it:
+                    dest_path = os.path.join(dest_root, entry.name)
+                    # Follow symlinked directories like shutil.copytree(symlinks=False) does
+                    if entry.is_dir():
+                        # The parent was created when it was pushed, so one mkdir suffices
+                        try:
+                            os.mkdir(dest_path)
+                        except FileExistsError:
+                            pass
+                        stack.append((entry.path, dest_path))
+                    else:
+                        copies.append((entry.path, dest_path))
+        if not copies:
+            return
+        with ThreadPoolExecutor(max_workers=min(16, len(copies))) as executor:
+            # Consume the results so the first failed copy is raised here
+            list(executor.map(lambda pair: copy_function(*pair), copies))
+
     def remove_files(self, target_dir: Path) -> bool:
         """
         Removes files from the target directory.
@@ -56,12 +134,16 @@ class FileOperations:
             bool: True if successful, False otherwise.
         """
         try:
-            if target_dir.is_symlink() or target_dir.is_file():
-                target_dir.unlink()
-                self.logger.info(f"Removed file/symlink: {target_dir}")
-            elif target_dir.is_dir():
+            try:
+                mode = os.lstat(target_dir).st_mode
+            except FileNotFoundError:
+                return True
+            if stat.S_ISDIR(mode):
                 shutil.rmtree(target_dir)
                 self.logger.info(f"Removed directory: {target_dir}")
+            else:
+                target_dir.unlink()
+                self.logger.info(f"Removed file/symlink: {target_dir}")
             return True
         except Exception as e:
             self.logger.error(f"Failed to remove files from {target_dir}: {e}")
@@ -90,12 +172,13 @@ class FileOperations:
             'custom_scripts': []
         }
         try:
-            for script_file in local_dir.glob('**/*.sh'):
+            prefix_len = len(str(local_dir)) + 1
+            for script_file in _iter_files_with_suffix(local_dir, '.sh'):
                 script_name = script_file.name.lower()
                 for phase in scripts_by_phase.keys():
                     if phase in script_name:
-                        scripts_by_phase[phase].append(str(script_file.relative_to(local_dir)))
-                        self.logger.debug(f"Discovered script {script_file} for phase {phase}")
+                        scripts_by_phase[phase].append(script_file.path[prefix_len:])
+                        self.logger.debug(f"Discovered script {script_file.path} for phase {phase}")
             if custom_scripts:
                 for script in custom_scripts:
                     scripts_by_phase['custom_scripts'].append(script)
@@ -1,13 +1,28 @@
 import os
 import platform
+import shutil
 import subprocess
 import asyncio
+import functools
 from typing import Optional, Dict, List, Tuple
 from src.utils import setup_logger
 from src.progress import ProgressTracker, ProgressContext
 
 logger = setup_logger()
 
+@functools.lru_cache(maxsize=None)
+def _nix_available(nix_path: str) -> bool:
+    """Runs `nix --version` once per nix binary path for the process lifetime."""
+    try:
+        result = subprocess.run(
+            [nix_path, "--version"],
+            capture_output=True,
+            text=True
+        )
+        return result.returncode == 0
+    except OSError:
+        return False
+
 class NixManager:
     """Manages Nix installation and configuration."""
     
@@ -54,17 +69,19 @@ class NixManager:
                 if not await self._check_requirements():
                     return False
                     
-                progress.update(20, "Preparing installation")
-                if not await self._prepare_installation(multi_user):
-                    return False
-                    
-                progress.update(30, "Downloading Nix installer")
-                if not await self._download_installer():
+                progress.update(50, "Preparing installation and downloading Nix installer")
+                # Neither step uses the other's result, so the download overlaps the setup
+                prepared, downloaded = await asyncio.gather(
+                    self._prepare_installation(multi_user),
+                    self._download_installer()
+                )
+                if not (prepared and downloaded):
                     return False
                     
                 progress.update(50, "Running Nix installer")
                 if not await self._run_installer(multi_user):
                     return False
+                _nix_available.cache_clear()
                     
                 progress.update(80, "Configuring Nix")
                 if not await self._configure_nix():
@@ -83,23 +100,20 @@ class NixManager:
                 
     def is_nix_installed(self) -> bool:
         """Check if Nix is installed."""
-        try:
-            result = subprocess.run(
-                ["nix", "--version"],
-                capture_output=True,
-                text=True
-            )
-            return result.returncode == 0
-        except:
+        nix_path = shutil.which("nix")
+        if nix_path is None:
             return False
+        return _nix_available(nix_path)
             
     async def _check_requirements(self) -> bool:
         """Check system requirements for Nix installation."""
         try:
             # Check for required commands
-            required_commands = ["curl", "sudo", "systemctl" if self.is_linux else ""]
-            for cmd in required_commands:
-                if cmd and not await self._check_command(cmd):
+            required_commands = ["curl", "sudo"] + (["systemctl"] if self.is_linux else [])
+            # Each lookup is its own subprocess; run them together
+            found = await asyncio.gather(*(self._check_command(cmd) for cmd in required_commands))
+            for cmd, available in zip(required_commands, found):
+                if not available:
                     logger.error(f"Required command not found: {cmd}")
                     return False
                     
@@ -123,11 +137,9 @@ class NixManager:
                 if not await self._run_command(["sudo", "groupadd", "-r", "nix-users"]):
                     return False
                     
-                # Create directories
-                dirs = ["/nix", "/etc/nix"]
-                for dir_path in dirs:
-                    if not await self._run_command(["sudo", "mkdir", "-p", dir_path]):
-                        return False
+                # Create directories in a single sudo invocation
+                if not await self._run_command(["sudo", "mkdir", "-p", "/nix", "/etc/nix"]):
+                    return False
                         
             return True
             
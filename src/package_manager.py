@@ -1,14 +1,17 @@
 # src/package_manager.py
 
 import platform
-from typing import List, Optional
+from typing import Dict, List, Optional, Set
 import logging
+import os
 import shutil
 import subprocess  # Imported at the top to avoid NameError in type annotations
 from contextlib import contextmanager  # Added to handle @contextmanager
 
 from .exceptions import PackageManagerError
 
+_HOME = os.path.expanduser("~")
+
 
 class PackageManagerInterface:
     """
@@ -25,6 +28,10 @@ class PackageManagerInterface:
         """Checks if a package is installed."""
         raise NotImplementedError
 
+    def installed_packages(self, packages: List[str]) -> Set[str]:
+        """Returns the subset of packages that is installed; managers that can query many at once override this."""
+        return {package for package in packages if self.is_installed(package)}
+
     def install_packages(self, packages: List[str]) -> bool:
         """Installs a list of packages."""
         raise NotImplementedError
@@ -60,18 +67,26 @@ class PacmanPackageManager(PackageManagerInterface):
             self.logger.debug(f"Package '{package}' not installed via Pacman.")
             return False
 
+    def installed_packages(self, packages: List[str]) -> Set[str]:
+        """Returns the installed subset of packages with a single Pacman query."""
+        if not packages:
+            return set()
+        try:
+            # -Qq prints the names it finds and fails only for the missing ones
+            result = self._run_command(["pacman", "-Qq"] + list(packages), check=False)
+        except PackageManagerError:
+            return set()
+        return set(result.stdout.split()) & set(packages)
+
     def install_packages(self, packages: List[str]) -> bool:
         """Installs packages using Pacman."""
         if not self.is_available():
             self.logger.error("Pacman package manager not found.")
             return False
 
-        if not self.update_db():
-            self.logger.error("Failed to update Pacman package database.")
-            return False
-
         try:
-            self._run_command(["sudo", "pacman", "-S", "--needed", "--noconfirm"] + packages)
+            # -y refreshes the databases in the same transaction, saving a separate sudo pacman -Sy run
+            self._run_command(["sudo", "pacman", "-Sy", "--needed", "--noconfirm"] + packages)
             self.logger.info(f"Successfully installed Pacman packages: {', '.join(packages)}")
             return True
         except PackageManagerError as e:
@@ -108,6 +123,7 @@ class PacmanPackageManager(PackageManagerInterface):
         try:
             result = subprocess.run(
                 command,
+                stdin=subprocess.DEVNULL,
                 capture_output=capture_output,
                 text=True,
                 check=check
@@ -154,6 +170,19 @@ class AptPackageManager(PackageManagerInterface):
             self.logger.debug(f"Package '{package}' not installed via APT.")
             return False
 
+    def installed_packages(self, packages: List[str]) -> Set[str]:
+        """Returns the installed subset of packages with a single dpkg query."""
+        if not packages:
+            return set()
+        try:
+            # Known packages are listed by name; unknown ones only produce errors on stderr
+            result = self._run_command(["dpkg-query", "-W", "-f=${Package}\n"] + list(packages), check=False)
+        except PackageManagerError:
+            return set()
+        listed = set(result.stdout.split())
+        # Names are listed without an architecture qualifier such as ':amd64'
+        return {package for package in packages if package.split(':', 1)[0] in listed}
+
     def install_packages(self, packages: List[str]) -> bool:
         """Installs packages using APT."""
         if not self.is_available():
@@ -202,6 +231,7 @@ class AptPackageManager(PackageManagerInterface):
         try:
             result = subprocess.run(
                 command,
+                stdin=subprocess.DEVNULL,
                 capture_output=capture_output,
                 text=True,
                 check=check
@@ -277,7 +307,7 @@ class AURHelperManager(PackageManagerInterface):
         try:
             with self._transactional_operation("install_aur_helper"):
                 # Clone the AUR helper repository
-                temp_dir = shutil.os.path.join(shutil.os.path.expanduser("~"), ".temp_aur_helper_install")
+                temp_dir = shutil.os.path.join(_HOME, ".temp_aur_helper_install")
                 if shutil.os.path.exists(temp_dir):
                     shutil.rmtree(temp_dir)
                     self.logger.debug(f"Removed existing temporary directory '{temp_dir}' for AUR helper installation.")
@@ -329,6 +359,7 @@ class AURHelperManager(PackageManagerInterface):
         try:
             result = subprocess.run(
                 command,
+                stdin=subprocess.DEVNULL,
                 capture_output=capture_output,
                 text=True,
                 check=check
@@ -380,6 +411,8 @@ class PackageManager(PackageManagerInterface):
         super().__init__(logger)
         self.manager: Optional[PackageManagerInterface] = None
         self.aur_helper_manager: Optional[AURHelperManager] = None
+        # Installed state per package, so repeated checks across phases skip the subprocess
+        self._installed_cache: Dict[str, bool] = {}
         self._initialize_manager()
 
     def _initialize_manager(self):
@@ -450,9 +483,33 @@ class PackageManager(PackageManagerInterface):
         Returns:
             bool: True if installed, False otherwise.
         """
-        if self.manager:
-            return self.manager.is_installed(package)
-        return False
+        if not self.manager:
+            return False
+        installed = self._installed_cache.get(package)
+        if installed is None:
+            installed = self._installed_cache[package] = self.manager.is_installed(package)
+        return installed
+
+    def installed_packages(self, packages: List[str]) -> Set[str]:
+        """
+        Returns the installed subset of packages, queried in one go where the manager supports it.
+
+        Only packages without a cached state are queried.
+
+        Args:
+            packages (List[str]): Package names to check.
+
+        Returns:
+            Set[str]: Names from packages that are installed.
+        """
+        if not self.manager:
+            return set()
+        unknown = [package for package in dict.fromkeys(packages) if package not in self._installed_cache]
+        if unknown:
+            found = self.manager.installed_packages(unknown)
+            for package in unknown:
+                self._installed_cache[package] = package in found
+        return {package for package in packages if self._installed_cache[package]}
 
     def install_packages(self, packages: List[str]) -> bool:
         """
@@ -464,9 +521,12 @@ class PackageManager(PackageManagerInterface):
         Returns:
             bool: True if installation was successful, False otherwise.
         """
-        if self.manager:
-            return self.manager.install_packages(packages)
-        return False
+        if not self.manager:
+            return False
+        if not self.manager.install_packages(packages):
+            return False
+        self._installed_cache.update(dict.fromkeys(packages, True))
+        return True
 
     def update_db(self) -> bool:
         """
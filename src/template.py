@@ -4,8 +4,6 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 import logging
 
-from jinja2 import Environment, FileSystemLoader, TemplateError
-
 from .exceptions import TemplateRenderingError
 
 class TemplateHandler:
@@ -33,8 +31,12 @@ class TemplateHandler:
         Returns:
             bool: True if successful, False otherwise.
         """
+        # Deferred so commands that never render templates do not pay for importing jinja2
+        from jinja2 import Environment, FileSystemLoader, TemplateError
+
         try:
             env = Environment(loader=FileSystemLoader(str(source_dir)))
+            created_dirs = set()
             for template_file in source_dir.glob('**/*.tpl'):
                 relative_path = template_file.relative_to(source_dir).with_suffix('')
                 target_file = target_dir / relative_path
@@ -43,7 +45,10 @@ class TemplateHandler:
                 template = env.get_template(str(template_file.relative_to(source_dir)))
                 rendered_content = template.render(context)
 
-                target_file.parent.mkdir(parents=True, exist_ok=True)
+                # Sibling templates share a parent; create each directory once
+                if target_file.parent not in created_dirs:
+                    target_file.parent.mkdir(parents=True, exist_ok=True)
+                    created_dirs.add(target_file.parent)
                 with target_file.open('w', encoding='utf-8') as f:
                     f.write(rendered_content)
                 self.logger.info(f"Rendered template {template_file} to {target_file}")
@@ -7,6 +7,18 @@ from src.utils import setup_logger
 
 logger = setup_logger()
 
+# File suffixes that mark a template
+_TEMPLATE_SUFFIXES = ('.j2', '.template', '.tpl', '.tmpl')
+_TEMPLATE_SUFFIX_RE = re.compile(r'\.(j2|template|tpl|tmpl)$')
+
+# {{ variable }}, {% if variable %} and {% for x in variable %} in one alternation,
+# so a template is scanned once; exactly one group is set per match
+_TEMPLATE_VARIABLE_RE = re.compile(
+    r'{{\s*(\w+)[^}]*}}'
+    r'|{%\s*if\s+(\w+)[^%]*%}'
+    r'|{%\s*for\s+\w+\s+in\s+(\w+)[^%]*%}'
+)
+
 class TemplateHandler:
     """Handles the processing and application of dotfile templates."""
     
@@ -48,18 +60,13 @@ class TemplateHandler:
             List of discovered template file paths
         """
         templates = []
-        template_patterns = [
-            r'\.j2$',
-            r'\.template$',
-            r'\.tpl$',
-            r'\.tmpl$'
-        ]
         
         try:
             for root, _, files in os.walk(directory):
+                root_prefix = os.path.join(root, '')
                 for file in files:
-                    if any(re.search(pattern, file) for pattern in template_patterns):
-                        templates.append(os.path.join(root, file))
+                    if file.endswith(_TEMPLATE_SUFFIXES):
+                        templates.append(root_prefix + file)
                         
             if templates:
                 self.logger.info(f"Discovered {len(templates)} template files")
@@ -126,13 +133,13 @@ class TemplateHandler:
         """
         success = True
         templates = self.discover_templates(source_dir)
+        # Discovered paths all start with source_dir, so slicing replaces relpath per template
+        source_prefix_len = len(os.path.join(source_dir, ''))
+        target_prefix = os.path.join(target_dir, '')
         
         for template_path in templates:
-            rel_path = os.path.relpath(template_path, source_dir)
-            output_path = os.path.join(
-                target_dir,
-                re.sub(r'\.(j2|template|tpl|tmpl)$', '', rel_path)
-            )
+            rel_path = template_path[source_prefix_len:]
+            output_path = target_prefix + _TEMPLATE_SUFFIX_RE.sub('', rel_path)
             
             if not self.process_template(template_path, output_path, context):
                 success = False
@@ -180,17 +187,9 @@ class TemplateHandler:
             with open(template_path, 'r', encoding='utf-8') as f:
                 content = f.read()
                 
-            # Find {{ variable }} patterns
-            var_pattern = r'{{\s*(\w+)[^}]*}}'
-            variables.update(re.findall(var_pattern, content))
-            
-            # Find {% if variable %} patterns
-            if_pattern = r'{%\s*if\s+(\w+)[^%]*%}'
-            variables.update(re.findall(if_pattern, content))
-            
-            # Find {% for x in variable %} patterns
-            for_pattern = r'{%\s*for\s+\w+\s+in\s+(\w+)[^%]*%}'
-            variables.update(re.findall(for_pattern, content))
+            # Find {{ variable }}, {% if variable %} and {% for x in variable %} patterns
+            for match in _TEMPLATE_VARIABLE_RE.finditer(content):
+                variables.add(match.group(match.lastindex))
             
         except Exception as e:
             self.logger.error(f"Error extracting variables from {template_path}: {e}")
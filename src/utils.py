@@ -1,6 +1,9 @@
 # src/utils.py
 
+import errno
 import logging
+import os
+import shutil
 import sys
 import re
 from pathlib import Path
@@ -30,6 +33,107 @@ def create_timestamp() -> str:
     """
     return time.strftime("%Y%m%d_%H%M%S")
 
+def fast_copy(src: str, dst: str) -> str:
+    """
+    Copies a file with its metadata, like shutil.copy2, but lets the kernel move the bytes.
+
+    os.copy_file_range keeps the data out of userspace and can reflink on filesystems
+    that support it. Where the call is unavailable or rejected, the copy falls back to
+    a plain buffered copy.
+
+    Args:
+        src (str): File to copy.
+        dst (str): Destination file path.
+
+    Returns:
+        str: The destination path.
+
+    Raises:
+        shutil.SameFileError: If src and dst are the same file, as shutil.copy2 does.
+    """
+    if not hasattr(os, 'copy_file_range'):
+        return shutil.copy2(src, dst)
+    # Opening dst for writing would truncate src when both name one file
+    try:
+        if os.path.samefile(src, dst):
+            raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+    except FileNotFoundError:
+        pass
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        try:
+            while os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30):
+                pass
+        except OSError:
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst)
+    shutil.copystat(src, dst)
+    return dst
+
+def same_filesystem(source: Path, target: Path) -> bool:
+    """
+    Checks whether source and target (or its nearest existing parent) share a device.
+
+    Args:
+        source (Path): Source path.
+        target (Path): Target path, which may not exist yet.
+
+    Returns:
+        bool: True if both are on the same filesystem, False otherwise.
+    """
+    try:
+        existing_target = target
+        while not existing_target.exists() and existing_target != existing_target.parent:
+            existing_target = existing_target.parent
+        return os.stat(source).st_dev == os.stat(existing_target).st_dev
+    except OSError:
+        return False
+
+def link_or_copy(src: str, dst: str) -> str:
+    """
+    Hardlinks src to dst, falling back to a kernel-side copy when linking is not possible.
+
+    Args:
+        src (str): Source file path.
+        dst (str): Destination file path.
+
+    Returns:
+        str: The destination path.
+    """
+    try:
+        os.link(src, dst)
+    except FileExistsError:
+        if os.path.samefile(src, dst):
+            return dst
+        os.unlink(dst)
+        return link_or_copy(src, dst)
+    except OSError as e:
+        if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK):
+            raise
+        # Still avoids a userspace copy, and reflinks where the filesystem allows
+        fast_copy(src, dst)
+    return dst
+
+def symlink_file(src: str, dst: str) -> str:
+    """
+    Symlinks dst to src, replacing whatever file or link is already at dst.
+
+    Args:
+        src (str): Source file path.
+        dst (str): Destination link path.
+
+    Returns:
+        str: The destination path.
+    """
+    src = os.path.abspath(src)
+    try:
+        os.symlink(src, dst)
+    except FileExistsError:
+        os.unlink(dst)
+        os.symlink(src, dst)
+    return dst
+
 def confirm_action(prompt: str) -> bool:
     """
     Prompts the user for confirmation.
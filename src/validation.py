@@ -8,6 +8,9 @@ from src.utils import setup_logger
 
 logger = setup_logger()
 
+# Parsed schemas keyed by (path, mtime_ns), shared by every validator in the process
+_SCHEMA_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
 @dataclass
 class ValidationError:
     """Represents a configuration validation error."""
@@ -25,17 +28,25 @@ class ConfigValidator:
     def _load_schemas(self):
         """Load JSON schemas for validation."""
         self.schemas = {}
-        if not self.schema_dir or not os.path.exists(self.schema_dir):
+        if not self.schema_dir:
             return
-            
-        for file in os.listdir(self.schema_dir):
-            if file.endswith('.json'):
-                try:
-                    with open(os.path.join(self.schema_dir, file), 'r') as f:
-                        name = os.path.splitext(file)[0]
-                        self.schemas[name] = json.load(f)
-                except Exception as e:
-                    logger.error(f"Error loading schema {file}: {e}")
+        try:
+            with os.scandir(self.schema_dir) as it:
+                schema_entries = [entry for entry in it
+                                  if entry.name.endswith('.json') and entry.is_file()]
+        except (FileNotFoundError, NotADirectoryError):
+            return
+
+        for entry in schema_entries:
+            try:
+                key = (entry.path, entry.stat().st_mtime_ns)
+                schema = _SCHEMA_CACHE.get(key)
+                if schema is None:
+                    with open(entry.path, 'rb') as f:
+                        schema = _SCHEMA_CACHE[key] = json.loads(f.read())
+                self.schemas[entry.name[:-len('.json')]] = schema
+            except Exception as e:
+                logger.error(f"Error loading schema {entry.name}: {e}")
                     
     def validate_config(self, config: Dict[str, Any], schema_name: str) -> List[ValidationError]:
         """Validate a configuration against a schema."""